@@ -1,10 +1,21 @@
 import sys
 import os
+
+# Pin the BLAS pools to one thread before numpy loads: the per-frame array
+# work here is small and memory-bound, and BLAS worker threads only contend
+# with the YOLO thread and the Qt event loop. OMP_NUM_THREADS is left alone
+# so Numba's parallel heatmap kernels keep their threads.
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("VECLIB_MAXIMUM_THREADS", "1")
+os.environ.setdefault("NUMEXPR_NUM_THREADS", "1")
+
 import cv2
 import torch
 import numpy as np
 import urllib.request
 import time
+import threading
 from collections import deque
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
@@ -16,9 +27,30 @@ from PyQt6.QtGui import QPixmap, QImage, QFont, QDragEnterEvent, QDropEvent, QPa
 
 import pyqtgraph as pg
 
+# OpenGL rendering sidesteps pyqtgraph's QPainterPath construction, the usual
+# live-plot bottleneck; fall back silently to the raster backend when PyOpenGL
+# is not installed. Antialiasing is disabled either way - invisible at this
+# line width but measurably cheaper.
+try:
+    import OpenGL  # noqa: F401
+    pg.setConfigOption('useOpenGL', True)
+    pg.setConfigOption('enableExperimental', True)
+except ImportError:
+    pass
+pg.setConfigOption('antialias', False)
+# Let pyqtgraph JIT its internal remap/downsample loops when numba is around
+# (same optional dependency the heatmap kernels use)
+try:
+    import numba  # noqa: F401
+    pg.setConfigOption('useNumba', True)
+except ImportError:
+    pass
+
 # Project modules
 from config import * 
-from core.threads import ModelDownloadThread, VideoFrameThread, YoloDetectionThread
+from core.heatmap import normalize_clamp, stamp_points, warmup_kernels
+from core.threads import (ModelDownloadThread, VideoFrameThread,
+                          YoloDetectionThread, open_video_capture)
 from ui.widgets import ToggleSwitch, ModernBoxedSlider, DragDropVideoLabel
 
 
@@ -50,6 +82,11 @@ class CrowdSenseApp(QMainWindow):
         self.export_graph_button = None
 
         self.available_models = available_models
+        # Combo-index-aligned views of the model table, so selection handling
+        # is a direct list index instead of itemData + dict lookups
+        self._model_keys = list(available_models.keys())
+        self._model_paths = [available_models[k]["path"] for k in available_models]
+        self._model_index = {k: i for i, k in enumerate(available_models)}
 
         # Initialize model to YOLOv8n by default
         self.current_model_key = "YOLOv8n (Nano)"
@@ -59,6 +96,16 @@ class CrowdSenseApp(QMainWindow):
         self.models_dir = os.path.join(os.getcwd(), "models")
         os.makedirs(self.models_dir, exist_ok=True)
 
+        # Snapshot which model files are already on disk: one scandir per
+        # directory at startup instead of stat() probes on every combo change
+        self._local_model_files = set()
+        for directory in (self.models_dir, os.getcwd()):
+            try:
+                with os.scandir(directory) as entries:
+                    self._local_model_files.update(e.name for e in entries)
+            except OSError:
+                pass
+
         # Flag to track if model is downloading
         self.model_downloading = False
         self.yolo_ready = False
@@ -68,6 +115,13 @@ class CrowdSenseApp(QMainWindow):
         self.video_thread = VideoFrameThread()
         self.video_thread.frame_ready.connect(self.process_video_frame)
         self.video_thread.video_ended.connect(self.on_video_ended) # Connect end signal
+        # Feed the detector directly from the capture thread; add_frame
+        # copies under its own lock, so no Qt event hop is needed
+        self.video_thread.frame_consumer = self._forward_frame_to_detector
+        # Let the capture thread skip decoding while a batch is in flight
+        # (reading a bool flag cross-thread is safe here; worst case is one
+        # extra decoded or skipped frame)
+        self.video_thread.detector_busy = self._detector_busy
 
         # Initialize YOLO detection thread
         self.yolo_thread = YoloDetectionThread(self.model_path)
@@ -77,16 +131,62 @@ class CrowdSenseApp(QMainWindow):
         # Initialize model download thread (will be created when needed)
         self.download_thread = None
 
+        # Memoized matplotlib (Figure, Canvas, Axes) for graph export reuse
+        self._export_fig = None
+
         # Frame buffers and detection data
         self.current_frame = None  # Raw current frame
         self.displayed_frame = None  # Processed frame with heatmap (if enabled)
+        self._display_buf = None  # Persistent buffer the display frame is composed into
+        self._scratch = {}  # Preallocated buffers for the heatmap display path
+        self._qimage = None  # Persistent QImage wrapping the display buffer
+        self._qimage_buffer = None  # The ndarray the QImage currently wraps
+        # Nearest-neighbor scaling for live playback (the next frame replaces
+        # the pixels in ~33 ms); resizeEvent swaps in smooth scaling for the
+        # held frame, where quality is actually visible
+        self._scale_mode = Qt.TransformationMode.FastTransformation
         self.last_detected_boxes = []  # Store the last detected boxes
 
+        # Debounce timer for splitter-driven redraws (coalesce move bursts)
+        self._splitter_redraw_timer = QTimer(self)
+        self._splitter_redraw_timer.setSingleShot(True)
+        self._splitter_redraw_timer.setInterval(16)
+        self._splitter_redraw_timer.timeout.connect(self._redraw_after_splitter_move)
+
+        # The people graph redraws at 10 Hz instead of once per detection:
+        # pyqtgraph updates cost several ms each and are indistinguishable
+        # above that rate
+        self._graph_timer = QTimer(self)
+        self._graph_timer.setInterval(100)
+        self._graph_timer.timeout.connect(self._flush_people_graph)
+        self._graph_timer.start()
+        self._graph_dirty = False  # Set when new samples arrive, cleared on flush
+        self._markers_dirty = False  # Same, for the peak/off-peak markers
+        self._graph_x_max = 0.0  # Last applied axis extents (range hysteresis)
+        self._graph_y_max = 0.0
+        self._graph_count_max = 0  # Running max of plotted counts (avoids per-flush scans)
+
+        # Debounce for the smoothing-window slider: a drag emits dozens of
+        # valueChanged ticks, only the settled value triggers the rebuild
+        self._smoothing_debounce_timer = QTimer(self)
+        self._smoothing_debounce_timer.setSingleShot(True)
+        self._smoothing_debounce_timer.setInterval(50)
+        self._smoothing_debounce_timer.timeout.connect(self._apply_smoothing_window)
+        self._pending_smoothing_window = self.smoothing_window_size
+
+        # Same trailing-edge pattern for the crowd-threshold slider
+        self._threshold_debounce_timer = QTimer(self)
+        self._threshold_debounce_timer.setSingleShot(True)
+        self._threshold_debounce_timer.setInterval(40)
+        self._threshold_debounce_timer.timeout.connect(self._apply_crowd_size_threshold)
+        self._pending_crowd_size_threshold = self.crowd_size_threshold
+
         # People counting
         self.people_count = 0
 
         self.smoothing_window_size = 24  # Default window size (used in init)
         self.people_count_history = deque(maxlen=self.smoothing_window_size)
+        self._history_sum = 0  # Running sum of the smoothing window
         self.smoothed_people_count = 0
 
         # Playback state
@@ -98,16 +198,36 @@ class CrowdSenseApp(QMainWindow):
         self.heatmap_opacity = 0.7
         self.heatmap_accumulator = None
         self.aggregate_heatmap_accumulator = None # This will store the aggregate heatmap with no decay
+        # Starts as the allocating version and swaps itself for a cheap shape
+        # check once buffers exist, keeping is-None branching out of the
+        # per-frame path
+        self._ensure_heatmap_buffers = self._init_heatmap_buffers
         self.aggregate_frame_count = 0  # Track how many frames contributed to aggregate
-        self.heatmap_decay = 0.99
+        self._aggregate_subsample = 3  # Phase counter for subsampled aggregation
+        # Keep the scalar factors as float32 so per-frame accumulator math
+        # never promotes to float64 (doubling the bytes moved per pass)
+        self.heatmap_decay = np.float32(0.99)
         self.heatmap_blur_size = 21
         self.heatmap_radius = 2
-        self.heatmap_intensity = 0.6
+        self.heatmap_intensity = np.float32(0.6)
         self.heatmap_scale_factor = 0.2
         self.heatmap_neighbor_radius = 4
+        # Blur kernels expressed in low-res grid cells: the 7/17/31 cascade
+        # was sized for full-res pixels, which is gratuitous on the scaled
+        # accumulator where each cell already covers a 5x5 pixel block
+        blur_ksizes = [
+            max(3, int(k * self.heatmap_scale_factor) | 1) for k in (7, 17, 31)
+        ]
+        # Convolving Gaussians adds variances, so the cascade collapses to a
+        # single pass with the equivalent sigma (one read/write of the
+        # accumulator instead of three). Sigmas follow OpenCV's auto-sigma
+        # formula for each kernel size.
+        blur_sigmas = [0.3 * ((k - 1) * 0.5 - 1) + 0.8 for k in blur_ksizes]
+        self.heatmap_blur_sigma = float(np.sqrt(sum(sig * sig for sig in blur_sigmas)))
 
         # Video timer properties
         self.video_time_ms = 0
+        self._skipped_grabs_seen = 0
         self.last_frame_time = 0
         self.frame_interval = 33  # Default frame interval
 
@@ -117,13 +237,74 @@ class CrowdSenseApp(QMainWindow):
         self.threshold_alert_active = False
         self.threshold_history = []  # Store alert history with timestamps
 
+        # Interned alert style variants: Qt re-parses CSS on every
+        # setStyleSheet call, so the two states are built exactly once
+        self._alert_styles_active = {
+            'container': """
+                background-color: #4e1c1c;
+                border-radius: 4px;
+                border: 1px solid #cc3232; /* Light red border */
+            """,
+            'icon': """
+                font-family: Arial;
+                font-size: 16px;
+                color: #ff5555;
+                border: none;
+            """,
+            'text': """
+                font-family: Arial;
+                font-size: 12px;
+                color: #ff9999;
+                border: none;
+            """,
+            'value': LARGE_VALUE_FONT_STYLE.replace(f"color: {ACCENT_COLOR}", "color: #ff5555"),
+        }
+        self._alert_styles_normal = {
+            'container': f"""
+                background-color: #2A2A2A;
+                border-radius: 4px;
+                border: 1px solid {BORDER_COLOR}; /* Grey border */
+            """,
+            'icon': """
+                font-family: Arial;
+                font-size: 16px;
+                color: #555555;
+                border: none;
+            """,
+            'text': """
+                font-family: Arial;
+                font-size: 12px;
+                color: #AAAAAA;
+                border: none;
+            """,
+            'value': LARGE_VALUE_FONT_STYLE,
+        }
+
         self.peak_count = 0
         self.peak_time_ms = 0
-        self.offpeak_count = float('inf')  # Start with infinity so any count will be lower
+        self.offpeak_count = -1  # Sentinel: no off-peak recorded yet (int, not inf)
         self.offpeak_time_ms = 0
+        # Last formatted timestamps, so unchanged label halves skip setText
+        self._last_peak_ms = -1
+        self._last_offpeak_ms = -1
         self.peak_marker = None
         self.offpeak_marker = None
 
+        # Pay the one-off JIT compile cost for the heatmap kernels now,
+        # not on the first video frame
+        warmup_kernels()
+
+        # Warm the matplotlib import in the background so the first graph
+        # export doesn't stall the UI for the cold import (~500 ms); the
+        # in-function import in export_count_graph becomes a cache hit
+        def _warm_matplotlib():
+            try:
+                import matplotlib.pyplot  # noqa: F401
+                import matplotlib.backends.backend_agg  # noqa: F401
+            except ImportError:
+                pass  # export_count_graph reports the missing dependency
+        threading.Thread(target=_warm_matplotlib, daemon=True).start()
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -203,8 +384,7 @@ class CrowdSenseApp(QMainWindow):
             self.model_combo.addItem(display_text, model_name)
 
         # Select the default model
-        default_index = list(self.available_models.keys()).index(self.current_model_key)
-        self.model_combo.setCurrentIndex(default_index)
+        self.model_combo.setCurrentIndex(self._model_index[self.current_model_key])
 
         # Connect model selection change event
         self.model_combo.currentIndexChanged.connect(self.on_model_changed)
@@ -519,10 +699,13 @@ class CrowdSenseApp(QMainWindow):
 
     def on_splitter_moved(self, pos, index):
         """Handle splitter movement to update video frame"""
-        # Force a resize event to update the video display
+        # Coalesce bursts of splitter moves into one redraw per display refresh
+        self._splitter_redraw_timer.start()
+
+    def _redraw_after_splitter_move(self):
+        """Redraw the current frame once a splitter move burst has settled"""
         if self.displayed_frame is not None and self.paused:
-            rgb_frame = cv2.cvtColor(self.displayed_frame, cv2.COLOR_BGR2RGB)
-            self.display_frame(rgb_frame)
+            self.display_frame(self.displayed_frame)
 
     def setup_video_output(self, parent_widget):
         # Apply styling directly to the parent widget
@@ -652,6 +835,20 @@ class CrowdSenseApp(QMainWindow):
 
         video_layout.addWidget(self.video_label)
 
+        # Threshold alert border/text drawn as a Qt overlay on top of the
+        # video label instead of into the image pixels, so alert frames cost
+        # no extra image traffic
+        self.alert_overlay = QFrame(self.video_label)
+        self.alert_overlay.setStyleSheet("border: 8px solid #C80000; background: transparent;")
+        self.alert_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.alert_overlay_text = QLabel(self.alert_overlay)
+        self.alert_overlay_text.setStyleSheet(
+            "color: #FF0000; font-family: Arial; font-size: 18px; "
+            "font-weight: bold; border: none; background: transparent;"
+        )
+        self.alert_overlay_text.move(18, 14)
+        self.alert_overlay.hide()
+
         # Add components to output layout
         output_layout.addWidget(header_container)
         output_layout.addWidget(timer_container)
@@ -836,10 +1033,39 @@ class CrowdSenseApp(QMainWindow):
 
         return people_graph_widget
 
+    def _create_extreme_markers(self):
+        """Create the (initially empty) peak/off-peak scatter markers so the
+        per-frame path only ever calls setData"""
+        self.peak_marker = self.people_graph_plot_widget.plot(
+             [], [], pen=None, symbol='o', symbolSize=10,
+             symbolBrush='#FF5555' # Red
+        )
+        self.offpeak_marker = self.people_graph_plot_widget.plot(
+             [], [], pen=None, symbol='o', symbolSize=10,
+             symbolBrush='#5599FF' # Blue
+        )
+
+    def _tune_graph_line(self, line):
+        """Apply the cheap-redraw options to a live plot line"""
+        line.setDownsampling(auto=True, method='peak')
+        line.setClipToView(True)
+        try:
+            # Skips the per-redraw NaN/inf scan; the series buffers only
+            # ever hold finite values (pyqtgraph >= 0.12.4)
+            line.setSkipFiniteCheck(True)
+        except AttributeError:
+            pass
+
     def setup_people_count_graph(self):
         """Setup the real-time people count graph with a modern look"""
-        self.people_data = []
-        self.time_data = []
+        # Preallocated series buffers: setData gets contiguous float32 views
+        # instead of converting growing Python lists every flush. Capacity is
+        # an hour of 30 FPS samples; the oldest half is shifted out if ever
+        # exceeded.
+        self._graph_capacity = 60 * 60 * 30
+        self.time_data = np.empty(self._graph_capacity, dtype=np.float32)
+        self.people_data = np.empty(self._graph_capacity, dtype=np.float32)
+        self._graph_n = 0
         self.people_graph_plot_widget = pg.PlotWidget()
 
         self.people_graph_plot_widget.setSizePolicy(
@@ -862,6 +1088,8 @@ class CrowdSenseApp(QMainWindow):
             symbolSize=4,
             symbol='o'
         )
+        self._tune_graph_line(self.people_graph_line)
+        self._create_extreme_markers()
 
         axis_color = '#888888'
         self.people_graph_plot_widget.getPlotItem().getAxis('bottom').setPen(pg.mkPen(color=axis_color, width=1))
@@ -1028,28 +1256,50 @@ class CrowdSenseApp(QMainWindow):
 
 
     def on_crowd_size_threshold_changed(self, value):
-        """Handle crowd size threshold slider change"""
-        self.crowd_size_threshold = value
+        """Handle crowd size threshold slider change (debounced)"""
+        self._pending_crowd_size_threshold = value
+        self._threshold_debounce_timer.start()
+
+    def _apply_crowd_size_threshold(self):
+        """Apply the last threshold value once the drag has settled"""
+        self.crowd_size_threshold = self._pending_crowd_size_threshold
         self.update_crowd_alert_status(False)
-        
+
+        # Reposition the threshold line in place (no per-frame setData)
+        if self.threshold_line is not None:
+             self.threshold_line.setValue(self.crowd_size_threshold)
+
         # Update threshold line on graph if enabled and running
         if self.crowd_detection_enabled and self.cap is not None and self.cap.isOpened() and not self.paused:
              self.update_people_graph(self.smoothed_people_count)
 
 
     def on_smoothing_window_changed(self, value):
-        """Handle smoothing window size slider change"""
-        current_history = list(self.people_count_history)
+        """Handle smoothing window size slider change (debounced)"""
+        self._pending_smoothing_window = value
+        self._smoothing_debounce_timer.start()
+
+    def _apply_smoothing_window(self):
+        """Apply the last slider value once the drag has settled"""
+        value = self._pending_smoothing_window
+        old_size = self.smoothing_window_size
+        if value == old_size:
+            return
         self.smoothing_window_size = value
-        self.people_count_history = deque(maxlen=value)
 
-        # Add back the existing history
-        for count in current_history[-value:]:
-            self.people_count_history.append(count)
+        history = self.people_count_history
+        if value < old_size:
+            # Shrinking: drop the oldest samples, keeping the running sum
+            # exact instead of re-summing the whole window
+            while len(history) > value:
+                self._history_sum -= history.popleft()
+        # Existing entries (and their sum) carry over unchanged; only the
+        # maxlen needs to change
+        self.people_count_history = deque(history, maxlen=value)
 
-        # Recalculate smoothed count
         if len(self.people_count_history) > 0:
-            self.smoothed_people_count = round(np.mean(self.people_count_history))
+            n = len(self.people_count_history)
+            self.smoothed_people_count = (self._history_sum + n // 2) // n
         else:
              self.smoothed_people_count = 0 # Default to 0 if history is empty
 
@@ -1082,32 +1332,21 @@ class CrowdSenseApp(QMainWindow):
 
         self.threshold_alert_active = alert_active
 
-        if alert_active:
-            self.alert_container.setStyleSheet("""
-                background-color: #4e1c1c;
-                border-radius: 4px;
-                border: 1px solid #cc3232; /* Light red border */
-            """)
-            self.alert_icon.setStyleSheet("""
-                font-family: Arial;
-                font-size: 16px;
-                color: #ff5555;
-                border: none;
-            """)
-            self.alert_text.setStyleSheet("""
-                font-family: Arial;
-                font-size: 12px;
-                color: #ff9999;
-                border: none;
-            """)
+        styles = self._alert_styles_active if alert_active else self._alert_styles_normal
+        self.alert_container.setStyleSheet(styles['container'])
+        self.alert_icon.setStyleSheet(styles['icon'])
+        self.alert_text.setStyleSheet(styles['text'])
+        if hasattr(self, 'people_count_value'):
+            self.people_count_value.setStyleSheet(styles['value'])
 
+        if alert_active:
             self.alert_text.setText(f"ALERT! {count} people detected (threshold: {self.crowd_size_threshold})")
 
-            # Also update people count display with alert styling
-            if hasattr(self, 'people_count_value'):
-                # Use LARGE_VALUE_FONT_STYLE but change color
-                alert_font_style = LARGE_VALUE_FONT_STYLE.replace(f"color: {ACCENT_COLOR}", "color: #ff5555")
-                self.people_count_value.setStyleSheet(alert_font_style)
+            self.alert_overlay_text.setText(f"ALERT! {count} people (threshold: {self.crowd_size_threshold})")
+            self.alert_overlay_text.adjustSize()
+            self.alert_overlay.setGeometry(self.video_label.rect())
+            self.alert_overlay.show()
+            self.alert_overlay.raise_()
 
             current_time_str = format_time_for_filename(self.video_time_ms)
             alert_record = {
@@ -1118,28 +1357,9 @@ class CrowdSenseApp(QMainWindow):
             self.threshold_history.append(alert_record)
 
         else:
-            self.alert_container.setStyleSheet(f"""
-                background-color: #2A2A2A;
-                border-radius: 4px;
-                border: 1px solid {BORDER_COLOR}; /* Grey border */
-            """)
-            self.alert_icon.setStyleSheet("""
-                font-family: Arial;
-                font-size: 16px;
-                color: #555555;
-                border: none;
-            """)
-            self.alert_text.setStyleSheet("""
-                font-family: Arial;
-                font-size: 12px;
-                color: #AAAAAA;
-                border: none;
-            """)
-
             self.alert_text.setText("People count is normal")
 
-            if hasattr(self, 'people_count_value'):
-                self.people_count_value.setStyleSheet(LARGE_VALUE_FONT_STYLE) # Use defined large style
+            self.alert_overlay.hide()
 
 
     def restart_video(self):
@@ -1172,12 +1392,15 @@ class CrowdSenseApp(QMainWindow):
 
         # Reset timer
         self.video_time_ms = 0
-        self.last_frame_time = time.time() # Reset last frame time as well
+        self._skipped_grabs_seen = 0
+        self.last_frame_time = time.perf_counter_ns() # Reset last frame time as well
         self.update_timer_display()
 
         # Reset graph data and visual elements
-        self.people_data.clear()
-        self.time_data.clear()
+        self._graph_n = 0
+        self._graph_x_max = 0.0
+        self._graph_y_max = 0.0
+        self._graph_count_max = 0  # Running max of plotted counts (avoids per-flush scans)
         self.people_graph_line.setData([], []) # Clear graph line data
 
         # Reset heatmap accumulators
@@ -1185,6 +1408,7 @@ class CrowdSenseApp(QMainWindow):
         self.heatmap_accumulator = None
         self.aggregate_heatmap_accumulator = None
         self.aggregate_frame_count = 0
+        self._ensure_heatmap_buffers = self._init_heatmap_buffers
 
 
         # Reset threshold alert state and graph elements
@@ -1200,80 +1424,40 @@ class CrowdSenseApp(QMainWindow):
         # Reset peak tracking and markers
         self.peak_count = 0
         self.peak_time_ms = 0
-        self.offpeak_count = float('inf')
+        self.offpeak_count = -1
         self.offpeak_time_ms = 0
+        self._last_peak_ms = -1
+        self._last_offpeak_ms = -1
         self.peak_time_value.setText("--:--:--")
         self.peak_count_value.setText("(0 people)")
         self.offpeak_time_value.setText("--:--:--")
         self.offpeak_count_value.setText("(0 people)")
 
-        if self.peak_marker is not None:
-            self.people_graph_plot_widget.removeItem(self.peak_marker)
-            self.peak_marker = None
-
-        if self.offpeak_marker is not None:
-            self.people_graph_plot_widget.removeItem(self.offpeak_marker)
-            self.offpeak_marker = None
+        self.peak_marker.setData([], [])
+        self.offpeak_marker.setData([], [])
 
         # Manually read first frame (thread-safe now that video thread is stopped)
         ret, first_frame = self.cap.read()
-        display_frame_processed = None
         if ret:
             # Store the raw frame
             self.current_frame = first_frame.copy()
 
-            # Process the first frame directly for immediate display
-            if self.yolo_ready and self.yolo_thread.model:
-                try:
-                     results = self.yolo_thread.model(first_frame, classes=0)
-                     boxes = []
-                     people_count = 0 # Count for the first frame
-                     for result in results:
-                          result_boxes = result.boxes
-                          for box in result_boxes:
-                               x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
-                               confidence = float(box.conf[0])
-                               if confidence > self.confidence_threshold:
-                                    boxes.append((x1, y1, x2, y2))
-                                    people_count += 1
-                                    # Optionally draw boxes on first_frame for immediate feedback
-                                    cv2.rectangle(first_frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-                                    conf_text = f"{confidence:.2f}"
-                                    cv2.putText(first_frame, conf_text, (x1, y1-5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-
-
-                     # Store these boxes for potential heatmap use
-                     self.last_detected_boxes = boxes
-                     # Update count display for the first frame
-                     self.people_count_history.clear() # Reset history
-                     self.people_count_history.append(people_count)
-                     self.smoothed_people_count = people_count
-                     self.people_count_value.setText(str(self.smoothed_people_count))
-                     # Update graph for the first point at time 0
-                     self.update_people_graph(self.smoothed_people_count)
-                     # Check threshold for the first frame
-                     if self.crowd_detection_enabled:
-                          self.check_threshold_crossing(first_frame) # Pass the frame
-
-                     # Apply heatmap if enabled
-                     display_frame_processed = self.process_frame_with_heatmap(first_frame, boxes)
-
-                except Exception as e:
-                     print(f"Error processing first frame on restart: {e}")
-                     # Fallback: use the raw frame without detections/heatmap
-                     display_frame_processed = first_frame.copy()
-            else:
-                 # YOLO not ready, use the raw frame
-                 display_frame_processed = first_frame.copy()
-                 self.last_detected_boxes = [] # No boxes detected
+            # Show the raw first frame without running YOLO synchronously:
+            # an inline forward pass froze the GUI for the duration of a full
+            # inference, and the detection thread re-infers this same frame
+            # as soon as playback resumes anyway
+            self.last_detected_boxes = []
+            self.people_count_history.clear()
+            self._history_sum = 0
+            display_frame_processed = self.process_frame_with_heatmap(first_frame, [])
+            if display_frame_processed is None:
+                 display_frame_processed = first_frame
 
-            # Convert to RGB for display
-            rgb_frame = cv2.cvtColor(display_frame_processed, cv2.COLOR_BGR2RGB)
             # Store the final displayed frame
             self.displayed_frame = display_frame_processed
 
-            # Display the frame
-            self.display_frame(rgb_frame)
+            # Display the frame (BGR goes straight to QImage)
+            self.display_frame(display_frame_processed)
 
             # Reset video position again after reading the first frame manually
             self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
@@ -1341,80 +1525,111 @@ class CrowdSenseApp(QMainWindow):
 
     def process_frame_with_heatmap(self, frame, boxes):
         """Process a frame, applying heatmap overlay if enabled"""
-        # Create a copy of the frame for display
+        # Compose into a persistent buffer instead of allocating a fresh
+        # full-frame copy every call
         # Important: Ensure frame is not None
         if frame is None:
              return None
 
-        display_frame = frame.copy()
-
-        # Apply heatmap overlay if enabled
-        if self.heatmap_enabled:
-            # Update heatmap with new positions - this adds to the accumulator
-            heatmap = self.update_heatmap(display_frame, boxes)
-
-            if heatmap is not None and np.max(heatmap) > 0:
-                 # Normalize heatmap for visualization (0 to 1)
-                 heatmap_norm = cv2.normalize(heatmap, None, alpha=0, beta=1, norm_type=cv2.NORM_MINMAX, dtype=cv2.CV_32F)
-
-                 # Ensure minimum value for blue background in low activity areas
-                 # Applying this after normalization might be more consistent
-                 viz_heatmap = np.maximum(heatmap_norm, 0.1)
-
-                 # Convert to 8-bit for colormap
-                 viz_heatmap_8bit = (viz_heatmap * 255).astype(np.uint8)
-
-                 # Apply JET colormap to get blue->green->red gradient
-                 heatmap_colored = cv2.applyColorMap(viz_heatmap_8bit, cv2.COLORMAP_JET)
-
-                 # Darken the original frame to make heatmap more visible
-                 darkened_frame = cv2.addWeighted(display_frame, 0.4, np.zeros_like(display_frame), 0.6, 0)
-
-                 # Blend the heatmap with the darkened original frame using heatmap_opacity
-                 display_frame = cv2.addWeighted(heatmap_colored, self.heatmap_opacity, darkened_frame, 1 - self.heatmap_opacity, 0)
-
-                 # Add grid lines for better visualization
-                 h, w = display_frame.shape[:2]
-                 grid_spacing = 50
-
-                 # Draw vertical grid lines
-                 for x in range(0, w, grid_spacing):
-                      cv2.line(display_frame, (x, 0), (x, h), GRID_COLOR, 1)
-
-                 # Draw horizontal grid lines
-                 for y in range(0, h, grid_spacing):
-                      cv2.line(display_frame, (0, y), (w, y), GRID_COLOR, 1)
-            # If heatmap is enabled but no heatmap data (e.g., no detections yet),
-            # still return the original frame copy
-            # else: # No heatmap data, return original frame copy
-                 # pass (display_frame is already frame.copy())
-
-        # Add threshold alert visualization if active (applied AFTER heatmap)
-        if self.crowd_detection_enabled and self.threshold_alert_active:
-            # Add red border to indicate alert
-            h, w = display_frame.shape[:2]
-            border_thickness = 8
-            border_color_bgr = (0, 0, 200) # Red in BGR
-            # Top border
-            display_frame[0:border_thickness, 0:w] = border_color_bgr
-            # Bottom border
-            display_frame[h-border_thickness:h, 0:w] = border_color_bgr
-            # Left border
-            display_frame[0:h, 0:border_thickness] = border_color_bgr
-            # Right border
-            display_frame[0:h, w-border_thickness:w] = border_color_bgr
-
-            # Add alert text
-            alert_text = f"ALERT! {self.smoothed_people_count} people (threshold: {self.crowd_size_threshold})"
-            # Position text inside the border
-            text_x = border_thickness + 10
-            text_y = border_thickness + 30
-            cv2.putText(display_frame, alert_text, (text_x, text_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 0, 255), 2) # Red text
+        # Nothing touches the pixels when the heatmap is off (the threshold
+        # alert is a Qt overlay, not drawn into the image), so skip the
+        # full-frame copy and hand the frame back as-is
+        if not self.heatmap_enabled:
+             return frame
+
+        if self._display_buf is None or self._display_buf.shape != frame.shape:
+            self._display_buf = np.empty_like(frame)
+        np.copyto(self._display_buf, frame)
+        display_frame = self._display_buf
+
+        # Update heatmap with new positions - this adds to the accumulator.
+        # The returned heatmap stays at the low accumulator resolution so
+        # all per-pixel math below touches ~25x fewer pixels.
+        heatmap = self.update_heatmap(display_frame, boxes)
+
+        # Idle-scene fast path: once the decayed accumulator fades
+        # below what the 8-bit colormap can show, skip the whole
+        # normalize/colormap/blend/grid block (the common case for a
+        # quiet scene) and display the plain frame
+        peak = float(heatmap.max()) if heatmap is not None else 0.0
+        if peak >= 0.05:
+             # All intermediates below live in preallocated scratch
+             # buffers (re-sized only when the resolution changes) so the
+             # per-frame path allocates nothing
+             frame_h, frame_w = display_frame.shape[:2]
+             scratch = self._scratch
+             if scratch.get('shapes') != (heatmap.shape, (frame_h, frame_w)):
+                  scratch['shapes'] = (heatmap.shape, (frame_h, frame_w))
+                  scratch['acc32'] = np.empty(heatmap.shape, dtype=np.float32)
+                  scratch['viz8'] = np.empty(heatmap.shape, dtype=np.uint8)
+                  scratch['color_small'] = np.empty(heatmap.shape + (3,), dtype=np.uint8)
+                  scratch['color'] = np.empty((frame_h, frame_w, 3), dtype=np.uint8)
+
+             # cv2 has no fp16 kernels for this path, so stage the
+             # half-precision accumulator up to float32 (low-res pass)
+             heatmap32 = scratch['acc32']
+             np.copyto(heatmap32, heatmap)
+
+             # Fused normalize + 8-bit conversion: the accumulator floor
+             # is 0, so min-max normalization reduces to dividing by the
+             # peak, and convertScaleAbs does scale + uint8 in one pass
+             viz_heatmap_8bit = cv2.convertScaleAbs(heatmap32, scratch['viz8'], alpha=255.0 / peak)
+
+             # Minimum value for blue background in low activity areas
+             # (uint8 equivalent of the former 0.1 floor)
+             np.maximum(viz_heatmap_8bit, 26, out=viz_heatmap_8bit)
+
+             # Apply JET colormap to get blue->green->red gradient while
+             # still at accumulator resolution, then upsample the colored
+             # result once; bilinear interpolation of the RGB values is
+             # indistinguishable at this level of blur
+             heatmap_colored_small = cv2.applyColorMap(viz_heatmap_8bit, cv2.COLORMAP_JET, dst=scratch['color_small'])
+             heatmap_colored = cv2.resize(heatmap_colored_small, (frame_w, frame_h),
+                                          scratch['color'], interpolation=cv2.INTER_LINEAR)
+
+             # Blend heatmap and frame in one pass, folding the former
+             # darkening step (frame * 0.4) into the frame weight
+             cv2.addWeighted(heatmap_colored, self.heatmap_opacity, display_frame, 0.4 * (1 - self.heatmap_opacity), 0, dst=display_frame)
+
+             # Add grid lines for better visualization: one cached bool
+             # mask and a single fancy-index store replace ~60 cv2.line
+             # calls per frame
+             grid_spacing = 50
+             if scratch.get('grid_shape') != (frame_h, frame_w):
+                  scratch['grid_shape'] = (frame_h, frame_w)
+                  grid_mask = np.zeros((frame_h, frame_w), dtype=bool)
+                  grid_mask[:, ::grid_spacing] = True
+                  grid_mask[::grid_spacing, :] = True
+                  scratch['grid_mask'] = grid_mask
+             display_frame[scratch['grid_mask']] = GRID_COLOR
+        # If there is no heatmap data yet (e.g. no detections), the plain
+        # frame copy is returned unchanged
+
+        # Threshold alert visualization is handled by the Qt overlay frame
+        # (see update_crowd_alert_status); the image buffer stays untouched
 
         return display_frame
 
 
+    def _init_heatmap_buffers(self, low_h, low_w):
+        """Allocate the heatmap accumulators, then swap in the cheap shape
+        check so later frames skip the allocation branches entirely.
+
+        Half precision: the decay/add/cap passes over these buffers are
+        memory-bound, and float16 keeps far more range than the 8-bit
+        visualization ever shows.
+        """
+        self.heatmap_accumulator = np.zeros((low_h, low_w), dtype=np.float16)
+        self.aggregate_heatmap_accumulator = np.zeros((low_h, low_w), dtype=np.float16)
+        self.aggregate_frame_count = 0
+        self._aggregate_subsample = 3
+        self._ensure_heatmap_buffers = self._check_heatmap_buffers
+
+    def _check_heatmap_buffers(self, low_h, low_w):
+        """Reallocate the accumulators only if the resolution changed"""
+        if self.heatmap_accumulator.shape != (low_h, low_w):
+            self._init_heatmap_buffers(low_h, low_w)
+
     def update_heatmap(self, frame, boxes):
         """Update the heatmap accumulator with new people positions using a low-resolution approach"""
         # Ensure frame is valid
@@ -1431,21 +1646,8 @@ class CrowdSenseApp(QMainWindow):
         if low_h <= 0 or low_w <= 0:
              return None # Cannot create heatmap for zero-sized dimensions
 
-        # Check if the frame resolution has changed
-        resolution_changed = False
-        if self.heatmap_accumulator is not None:
-            current_low_h, current_low_w = self.heatmap_accumulator.shape
-            if current_low_h != low_h or current_low_w != low_w:
-                 resolution_changed = True
-
-        # Initialize low-resolution heatmap accumulator if not exists or resolution changed
-        if self.heatmap_accumulator is None or resolution_changed:
-            self.heatmap_accumulator = np.zeros((low_h, low_w), dtype=np.float32)
-
-        # Initialize aggregate heatmap accumulator if not exists or resolution changed
-        if self.aggregate_heatmap_accumulator is None or resolution_changed:
-            self.aggregate_heatmap_accumulator = np.zeros((low_h, low_w), dtype=np.float32)
-            self.aggregate_frame_count = 0 # Reset count if resolution changed
+        # Make sure the accumulators exist and match the current resolution
+        self._ensure_heatmap_buffers(low_h, low_w)
 
 
         # Apply decay to existing heatmap (only the regular one, not the aggregate)
@@ -1454,52 +1656,27 @@ class CrowdSenseApp(QMainWindow):
         # Create a new low-resolution heatmap for current positions
         current_heatmap = np.zeros((low_h, low_w), dtype=np.float32)
 
-        # Add detected people positions to current heatmap
-        detections_in_frame = False
-        for box in boxes:
-            # Scale down coordinates to low resolution
-            x1, y1, x2, y2 = box
-
-            # Use bottom center of bounding box (feet position)
-            foot_x = int((x1 + x2) / 2 * scale_factor)
-            foot_y = int(y2 * scale_factor)
-
-            # Ensure coordinates are within frame boundaries
-            foot_x = max(0, min(low_w - 1, foot_x))
-            foot_y = max(0, min(low_h - 1, foot_y))
-
-            # Add a point with intensity 1.0
-            current_heatmap[foot_y, foot_x] = 1.0
-            detections_in_frame = True
-
-            # Add intensity to surrounding pixels (optional, based on original code)
-            radius = self.heatmap_neighbor_radius
-            y_min = max(0, foot_y - radius)
-            y_max = min(low_h - 1, foot_y + radius)
-            x_min = max(0, foot_x - radius)
-            x_max = min(low_w - 1, foot_x + radius)
-
-            # Efficiently update neighbors using slicing and distance calculation if needed,
-            # or simpler loop as in original:
-            for y in range(y_min, y_max + 1):
-                 for x in range(x_min, x_max + 1):
-                      if x == foot_x and y == foot_y:
-                           continue
-                      dist_sq = (x - foot_x)**2 + (y - foot_y)**2
-                      if dist_sq <= radius**2:
-                           # Example: linear falloff based on distance
-                           dist = np.sqrt(dist_sq)
-                           intensity = max(0.0, 1.0 - (dist / radius)) * 0.7 # Weighted intensity
-                           current_heatmap[y, x] = max(current_heatmap[y, x], intensity)
-
-
-
-        # Apply Gaussian blur passes only if there were detections
+        # Add detected people positions to current heatmap via the compiled
+        # splat kernel (one call per frame instead of per-pixel Python loops)
+        detections_in_frame = len(boxes) > 0
+        if detections_in_frame:
+            # Compute all foot points (bottom center of each bounding box) in
+            # one vectorized pass over the box array, scaled down and clamped
+            # to the low-res grid
+            boxes_arr = np.asarray(boxes, dtype=np.float32)
+            foot_xs = ((boxes_arr[:, 0] + boxes_arr[:, 2]) * (0.5 * scale_factor)).astype(np.int64)
+            foot_ys = (boxes_arr[:, 3] * scale_factor).astype(np.int64)
+            np.clip(foot_xs, 0, low_w - 1, out=foot_xs)
+            np.clip(foot_ys, 0, low_h - 1, out=foot_ys)
+
+            stamp_points(current_heatmap, foot_xs, foot_ys, self.heatmap_neighbor_radius)
+
+        # Apply Gaussian blur only if there were detections: one pass with
+        # the sigma equivalent to the old multi-pass cascade
         if detections_in_frame:
-             # Multiple blur passes as in original logic
-             current_heatmap = cv2.GaussianBlur(current_heatmap, (7, 7), 0)
-             current_heatmap = cv2.GaussianBlur(current_heatmap, (17, 17), 0)
-             current_heatmap = cv2.GaussianBlur(current_heatmap, (31, 31), 0)
+             current_heatmap = cv2.GaussianBlur(current_heatmap, (0, 0),
+                                                self.heatmap_blur_sigma,
+                                                borderType=cv2.BORDER_REPLICATE)
 
              # Normalize the current heatmap before adding to accumulators
              max_val = np.max(current_heatmap)
@@ -1512,27 +1689,30 @@ class CrowdSenseApp(QMainWindow):
         # Add current heatmap to accumulator with appropriate intensity
         self.heatmap_accumulator += current_heatmap * self.heatmap_intensity
 
-        # Add to aggregate heatmap accumulator without decay only if detections occurred
+        # Add to aggregate heatmap accumulator without decay only if
+        # detections occurred, subsampled to every 4th such frame: the export
+        # normalizes by the aggregate's own peak, so a quarter of the samples
+        # produces the same picture for a quarter of the full-buffer adds
         if detections_in_frame:
-            self.aggregate_heatmap_accumulator += current_heatmap # Add the normalized, blurred heatmap
-            self.aggregate_frame_count += 1
+            self._aggregate_subsample += 1
+            if self._aggregate_subsample >= 4:
+                self._aggregate_subsample = 0
+                self.aggregate_heatmap_accumulator += current_heatmap # Add the normalized, blurred heatmap
+                self.aggregate_frame_count += 1
 
         # Cap the maximum value of the decaying accumulator to prevent excessive brightness
-        # This normalization should happen *after* adding the current frame's intensity
-        max_accum_val = np.max(self.heatmap_accumulator)
-        if max_accum_val > 1.0:
-            self.heatmap_accumulator /= max_accum_val
-        # Ensure accumulator values stay non-negative
-        self.heatmap_accumulator = np.maximum(self.heatmap_accumulator, 0.0)
+        # This normalization should happen *after* adding the current frame's intensity,
+        # fused with the non-negative clamp into one in-place kernel
+        normalize_clamp(self.heatmap_accumulator)
 
 
-        # Upsample back to original resolution for display
-        # Use INTER_LINEAR for smoother results
-        return cv2.resize(self.heatmap_accumulator, (w, h), interpolation=cv2.INTER_LINEAR)
+        # Return the low-resolution accumulator as-is; the display path
+        # normalizes and colorizes at this resolution and upsamples once
+        return self.heatmap_accumulator
 
 
     def update_people_graph(self, count):
-        """Update the people count graph with new data and threshold line"""
+        """Record a new people count sample for the graph"""
         # Only update when playing video (not paused or stopped)
         if self.cap is None or not self.cap.isOpened() or self.paused:
             return
@@ -1541,67 +1721,94 @@ class CrowdSenseApp(QMainWindow):
         current_time_sec = self.video_time_ms / 1000.0
 
         # Add current time and count to data (only if time has advanced)
-        if not self.time_data or current_time_sec > self.time_data[-1]:
-            self.time_data.append(current_time_sec)
-            self.people_data.append(count)
-        elif self.time_data: # If time hasn't advanced, update the last count value
-             self.people_data[-1] = count
+        n = self._graph_n
+        if n == 0 or current_time_sec > self.time_data[n - 1]:
+            if n == self._graph_capacity:
+                 # Full: shift the newest half down and keep appending
+                 half = self._graph_capacity // 2
+                 self.time_data[:half] = self.time_data[half:]
+                 self.people_data[:half] = self.people_data[half:]
+                 n = half
+            self.time_data[n] = current_time_sec
+            self.people_data[n] = count
+            self._graph_n = n + 1
+        else: # If time hasn't advanced, update the last count value
+             self.people_data[n - 1] = count
+
+        if count > self._graph_count_max:
+            self._graph_count_max = count
+
+        self._graph_dirty = True
+
+    def _flush_people_graph(self):
+        """Redraw the people graph from the buffered data (10 Hz timer slot)"""
+        # Skip the whole redraw when no sample arrived since the last tick
+        # (paused, stopped, or model still loading)
+        if not self._graph_dirty or self._graph_n == 0:
+            return
+        self._graph_dirty = False
 
+        n = self._graph_n
+        current_time_sec = float(self.time_data[n - 1])
 
-        # Update the graph line data
-        self.people_graph_line.setData(self.time_data, self.people_data)
+        # Update the graph line data (views into the preallocated buffers)
+        self.people_graph_line.setData(self.time_data[:n], self.people_data[:n])
 
-        # Add or update threshold line if crowd detection is enabled
+        # Add threshold line if crowd detection is enabled
         if self.crowd_detection_enabled:
-            # Determine the extent of the threshold line based on current time
-            max_time_display = max(current_time_sec + 10, 60) # Extend slightly beyond current time
-
             if self.threshold_line is None:
-                # Create a new threshold line - dashed horizontal line
+                # A horizontal InfiniteLine spans the view on its own: created
+                # once here, repositioned only when the threshold slider
+                # settles - never touched again during playback
                 pen = pg.mkPen(color='r', width=1, style=Qt.PenStyle.DashLine)
-                self.threshold_line = self.people_graph_plot_widget.plot(
-                    [0, max_time_display],
-                    [self.crowd_size_threshold, self.crowd_size_threshold],
-                    pen=pen,
-                    name='Threshold'
-                )
-            else:
-                # Update existing threshold line's data and range
-                self.threshold_line.setData(
-                    [0, max_time_display],
-                    [self.crowd_size_threshold, self.crowd_size_threshold]
+                self.threshold_line = pg.InfiniteLine(
+                    pos=self.crowd_size_threshold, angle=0, pen=pen
                 )
+                self.people_graph_plot_widget.addItem(self.threshold_line)
 
             # Color the graph segment if alert is active
-            if self.threshold_alert_active and len(self.time_data) >= 2:
+            if self.threshold_alert_active and n >= 2:
                  red_pen = pg.mkPen(color='r', width=3)
                  if self.alert_segment is None:
                       self.alert_segment = self.people_graph_plot_widget.plot(
-                           self.time_data[-2:], self.people_data[-2:], pen=red_pen
+                           self.time_data[n - 2:n], self.people_data[n - 2:n], pen=red_pen
                       )
                  else:
-                      self.alert_segment.setData(self.time_data[-2:], self.people_data[-2:])
+                      self.alert_segment.setData(self.time_data[n - 2:n], self.people_data[n - 2:n])
             elif not self.threshold_alert_active and self.alert_segment is not None:
                  # Remove the alert segment if the alert is no longer active
                  self.people_graph_plot_widget.removeItem(self.alert_segment)
                  self.alert_segment = None
 
-        # Always show the full time range from 0 to current time + padding
+        # Always show the full time range from 0 to current time + padding,
+        # but only re-issue setXRange when the view has drifted beyond a
+        # hysteresis band - each range change invalidates the whole scene
         if current_time_sec >= 0: # Check if time is valid
              padding = max(current_time_sec * 0.05, 1.0) # At least 1s padding or 5%
-             self.people_graph_plot_widget.setXRange(0, current_time_sec + padding, padding=0) # Use padding argument
-
-        # Adjust y-axis range dynamically with padding
-        if self.people_data:
+             x_max = current_time_sec + padding
+             if x_max > self._graph_x_max or x_max < self._graph_x_max * 0.5:
+                  self._graph_x_max = x_max * 1.05  # Grow a little past the need
+                  self.people_graph_plot_widget.setXRange(0, self._graph_x_max, padding=0)
+
+        # Repaint the peak/off-peak markers at most once per flush
+        if self._markers_dirty:
+            self._markers_dirty = False
+            self._update_extreme_markers()
+
+        # Adjust y-axis range dynamically with padding, same hysteresis idea
+        if n:
             min_count = 0 # Y-axis starts at 0
-            max_count_data = max(self.people_data) if self.people_data else 0
+            max_count_data = self._graph_count_max
             # Consider threshold value for max range if enabled
             max_count_threshold = self.crowd_size_threshold if self.crowd_detection_enabled else 0
             max_count = max(max_count_data, max_count_threshold, 1) # Ensure range is at least 1
 
             y_padding = max(max_count * 0.1, 1) # 10% padding or at least 1
-            # Set range from 0 up to max_count + padding
-            self.people_graph_plot_widget.setYRange(min_count, max_count + y_padding, padding=0)
+            y_max = max_count + y_padding
+            if y_max > self._graph_y_max or y_max < self._graph_y_max * 0.5:
+                 self._graph_y_max = y_max
+                 # Set range from 0 up to max_count + padding
+                 self.people_graph_plot_widget.setYRange(min_count, y_max, padding=0)
 
 
     def on_threshold_changed(self, value):
@@ -1630,10 +1837,9 @@ class CrowdSenseApp(QMainWindow):
 
              if display_frame is not None:
                   # Store the updated displayed frame
-                  self.displayed_frame = display_frame.copy()
+                  self.displayed_frame = display_frame
                   # Convert to RGB and display
-                  rgb_frame = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-                  self.display_frame(rgb_frame)
+                  self.display_frame(display_frame)
 
 
     def on_model_changed(self, index):
@@ -1641,26 +1847,27 @@ class CrowdSenseApp(QMainWindow):
         if index < 0:
             return
 
-        # Get selected model key
-        model_key = self.model_combo.itemData(index)
-        if not model_key or model_key == self.current_model_key:
+        # Get selected model key (combo indices align with the model table)
+        model_key = self._model_keys[index]
+        if model_key == self.current_model_key:
             return
 
         # Update current model
         self.current_model_key = model_key
-        model_info = self.available_models[model_key]
 
         # Construct potential paths
-        model_filename = model_info["path"]
+        model_filename = self._model_paths[index]
         path_in_models_dir = os.path.join(self.models_dir, model_filename)
         path_in_current_dir = os.path.join(os.getcwd(), model_filename)
 
 
-        # Check if model exists
-        if os.path.exists(path_in_models_dir):
-             model_path_to_use = path_in_models_dir
-        elif os.path.exists(path_in_current_dir):
-             model_path_to_use = path_in_current_dir
+        # Check against the startup directory snapshot (kept current by
+        # on_download_complete) instead of hitting the filesystem
+        if model_filename in self._local_model_files:
+            if os.path.exists(path_in_models_dir):
+                model_path_to_use = path_in_models_dir
+            else:
+                model_path_to_use = path_in_current_dir
         else:
              # Model doesn't exist locally, need to download
              self.download_model(model_key)
@@ -1732,6 +1939,7 @@ class CrowdSenseApp(QMainWindow):
         if success:
             # Update model path state
             self.model_path = model_path
+            self._local_model_files.add(os.path.basename(model_path))
 
             # Don't automatically load model here, just update status
             self.model_status.setText(f"YOLO Model: {self.current_model_key} downloaded.")
@@ -1767,11 +1975,7 @@ class CrowdSenseApp(QMainWindow):
             default_model_path_cwd = os.path.join(os.getcwd(), default_model_info["path"])
 
             # Find the index of the default model in the combo box
-            default_index = -1
-            for i in range(self.model_combo.count()):
-                 if self.model_combo.itemData(i) == default_model_key:
-                      default_index = i
-                      break
+            default_index = self._model_index.get(default_model_key, -1)
 
             if default_index != -1:
                  self.model_combo.setCurrentIndex(default_index) # Revert UI selection
@@ -1843,7 +2047,7 @@ class CrowdSenseApp(QMainWindow):
 
         # Initialize video capture
         try:
-            self.cap = cv2.VideoCapture(file_path)
+            self.cap = open_video_capture(file_path)
             if not self.cap.isOpened():
                 print(f"Error: Failed to open video file {file_path} with OpenCV.")
                 self.video_label.set_default_content()
@@ -1861,31 +2065,43 @@ class CrowdSenseApp(QMainWindow):
 
         # --- Reset states for new video ---
         self.video_time_ms = 0
-        self.last_frame_time = time.time() # Initialize timer baseline
+        self._skipped_grabs_seen = 0
+        self.last_frame_time = time.perf_counter_ns() # Initialize timer baseline
         self.update_timer_display()
 
         # Reset graph data and visual elements
-        self.people_data.clear()
-        self.time_data.clear()
-        self.people_graph_line.setData([], [])
-        if self.threshold_line: self.people_graph_plot_widget.removeItem(self.threshold_line); self.threshold_line = None
-        if self.alert_segment: self.people_graph_plot_widget.removeItem(self.alert_segment); self.alert_segment = None
-        if self.peak_marker: self.people_graph_plot_widget.removeItem(self.peak_marker); self.peak_marker = None
-        if self.offpeak_marker: self.people_graph_plot_widget.removeItem(self.offpeak_marker); self.offpeak_marker = None
+        self._graph_n = 0
+        self._graph_x_max = 0.0
+        self._graph_y_max = 0.0
+        self._graph_count_max = 0  # Running max of plotted counts (avoids per-flush scans)
+        # Suspend plot repaints so the batch of removals composites once
+        self.people_graph_plot_widget.setUpdatesEnabled(False)
+        try:
+            self.people_graph_line.setData([], [])
+            if self.threshold_line: self.people_graph_plot_widget.removeItem(self.threshold_line); self.threshold_line = None
+            if self.alert_segment: self.people_graph_plot_widget.removeItem(self.alert_segment); self.alert_segment = None
+            self.peak_marker.setData([], [])
+            self.offpeak_marker.setData([], [])
+        finally:
+            self.people_graph_plot_widget.setUpdatesEnabled(True)
 
         # Reset heatmaps
         self.heatmap_accumulator = None
         self.aggregate_heatmap_accumulator = None
         self.aggregate_frame_count = 0
+        self._ensure_heatmap_buffers = self._init_heatmap_buffers
 
         # Reset counts and history
         self.people_count_history.clear()
+        self._history_sum = 0
         self.smoothed_people_count = 0
         self.people_count_value.setText("0")
         self.peak_count = 0
         self.peak_time_ms = 0
-        self.offpeak_count = float('inf')
+        self.offpeak_count = -1
         self.offpeak_time_ms = 0
+        self._last_peak_ms = -1
+        self._last_offpeak_ms = -1
         self.peak_time_value.setText("--:--:--")
         self.peak_count_value.setText("(0 people)")
         self.offpeak_time_value.setText("--:--:--")
@@ -1943,7 +2159,7 @@ class CrowdSenseApp(QMainWindow):
             self.pause_button.setEnabled(True)
             self.end_playback_label.setVisible(False) # Hide end label on resume
             # Restart timer baseline on resume
-            self.last_frame_time = time.time()
+            self.last_frame_time = time.perf_counter_ns()
             return
 
         # Case 2: Start new video from dropdown
@@ -1986,7 +2202,7 @@ class CrowdSenseApp(QMainWindow):
                 self.pause_button.setEnabled(True)
                 self.end_playback_label.setVisible(False) # Hide end label on resume
                 # Restart timer baseline on resume
-                self.last_frame_time = time.time()
+                self.last_frame_time = time.perf_counter_ns()
 
 
     def stop_video(self):
@@ -2003,7 +2219,7 @@ class CrowdSenseApp(QMainWindow):
 
         # Pause YOLO processing and clear its queue
         if hasattr(self, 'yolo_thread') and self.yolo_thread is not None:
-            self.yolo_thread.frame_queue = [] # Clear pending frames
+            self.yolo_thread.clear_queue() # Clear pending frames
             # Don't stop the YOLO thread itself, just clear queue
 
         # Release video capture object safely
@@ -2029,6 +2245,7 @@ class CrowdSenseApp(QMainWindow):
         # Reset counts and smoothing history
         self.people_count = 0
         self.people_count_history.clear()
+        self._history_sum = 0
         self.smoothed_people_count = 0
         self.people_count_value.setText("0")
         self.people_count_value.setStyleSheet(LARGE_VALUE_FONT_STYLE) # Reset style
@@ -2036,6 +2253,7 @@ class CrowdSenseApp(QMainWindow):
 
         # Reset video timer
         self.video_time_ms = 0
+        self._skipped_grabs_seen = 0
         self.last_frame_time = 0
         self.update_timer_display()
         self.end_playback_label.setVisible(False) # Hide end label
@@ -2044,29 +2262,39 @@ class CrowdSenseApp(QMainWindow):
         self.heatmap_accumulator = None
         self.aggregate_heatmap_accumulator = None
         self.aggregate_frame_count = 0
+        self._ensure_heatmap_buffers = self._init_heatmap_buffers
 
-        # Clear graph data and visual elements
-        self.people_graph_plot_widget.clear() # Clears all items from the plot
-        # Recreate the main plot line after clearing
-        self.people_graph_line = self.people_graph_plot_widget.plot(
-             [], [], pen=pg.mkPen(color=ACCENT_COLOR, width=3),
-             symbolBrush=pg.mkBrush(LIGHTER_ACCENT_COLOR), symbolPen=pg.mkPen(LIGHTER_ACCENT_COLOR),
-             symbolSize=4, symbol='o'
-        )
-        self.people_data = []
-        self.time_data = []
-        # Reset plot item references
+        # Clear graph data and visual elements; pause repaints so the clear
+        # and the line recreation composite in a single pass
+        self.people_graph_plot_widget.setUpdatesEnabled(False)
+        try:
+            self.people_graph_plot_widget.clear() # Clears all items from the plot
+            # Recreate the main plot line after clearing
+            self.people_graph_line = self.people_graph_plot_widget.plot(
+                 [], [], pen=pg.mkPen(color=ACCENT_COLOR, width=3),
+                 symbolBrush=pg.mkBrush(LIGHTER_ACCENT_COLOR), symbolPen=pg.mkPen(LIGHTER_ACCENT_COLOR),
+                 symbolSize=4, symbol='o'
+            )
+            self._tune_graph_line(self.people_graph_line)
+            self._create_extreme_markers()
+        finally:
+            self.people_graph_plot_widget.setUpdatesEnabled(True)
+        self._graph_n = 0
+        self._graph_x_max = 0.0
+        self._graph_y_max = 0.0
+        self._graph_count_max = 0  # Running max of plotted counts (avoids per-flush scans)
+        # Reset plot item references (markers were recreated above)
         self.threshold_line = None
         self.alert_segment = None
-        self.peak_marker = None
-        self.offpeak_marker = None
 
 
         # Reset peak tracking display
         self.peak_count = 0
         self.peak_time_ms = 0
-        self.offpeak_count = float('inf')
+        self.offpeak_count = -1
         self.offpeak_time_ms = 0
+        self._last_peak_ms = -1
+        self._last_offpeak_ms = -1
         self.peak_time_value.setText("--:--:--")
         self.peak_count_value.setText("(0 people)")
         self.offpeak_time_value.setText("--:--:--")
@@ -2152,112 +2380,129 @@ class CrowdSenseApp(QMainWindow):
         if frame is None:
             return
 
-        # Update video timer (only if not paused)
+        # Update video timer (only if not paused). One monotonic sample per
+        # frame: perf_counter_ns is cheaper than the wall clock, immune to
+        # clock adjustments, and integer ns avoids float rounding
         if not self.paused:
-            current_time = time.time()
+            now_ns = time.perf_counter_ns()
             if self.last_frame_time > 0:
-                elapsed = int((current_time - self.last_frame_time) * 1000) # ms
+                elapsed = (now_ns - self.last_frame_time) // 1_000_000 # ms
                 # Use frame interval as a more reliable timing increment if available
                 # or cap elapsed time to avoid jumps during lag/resizes.
                 increment = self.frame_interval if self.frame_interval > 0 else max(1, elapsed)
                 # Avoid huge jumps if processing lagged significantly
                 increment = min(increment, 250) # Cap increment to e.g., 250ms
+                # Grab-skipped frames (decode bypassed while detection was
+                # busy) advanced the stream without an emission; credit
+                # their playback time here so the clock, graph x-axis and
+                # peak timestamps keep tracking the source
+                skipped_total = self.video_thread.skipped_grabs
+                skipped = skipped_total - self._skipped_grabs_seen
+                self._skipped_grabs_seen = skipped_total
+                if skipped > 0:
+                    increment += skipped * (self.frame_interval if self.frame_interval > 0 else 33)
                 self.video_time_ms += increment
-            self.last_frame_time = current_time
+            self.last_frame_time = now_ns
             self.update_timer_display()
 
-        # Store the raw frame (for heatmap processing later maybe, or resize)
-        self.current_frame = frame.copy()
+        # Store the raw frame (for heatmap processing later maybe, or resize).
+        # Holding the reference is safe: frame_ready emits a snapshot, not
+        # the capture thread's pooled decode buffer
+        self.current_frame = frame
 
-        # Send the frame to YOLO thread for detection if model is ready
-        if self.yolo_ready and self.yolo_thread.model:
-            self.yolo_thread.add_frame(frame)
-        else:
+        # Detection feeding happens on the capture thread via
+        # _forward_frame_to_detector; this GUI slot only handles display
+        if not (self.yolo_ready and self.yolo_thread.model):
             # If YOLO is not ready, display the raw frame without detection/heatmap
             # Process with empty boxes list for consistency
             display_frame_no_yolo = self.process_frame_with_heatmap(frame, [])
 
             if display_frame_no_yolo is not None:
-                 self.displayed_frame = display_frame_no_yolo.copy()
-                 rgb_frame = cv2.cvtColor(self.displayed_frame, cv2.COLOR_BGR2RGB)
-                 self.display_frame(rgb_frame)
+                 self.displayed_frame = display_frame_no_yolo
+                 self.display_frame(self.displayed_frame)
             # If YOLO is loading, status message should already indicate that
 
 
+    def _detector_busy(self):
+        """Runs on the capture thread: True while detection is mid-batch"""
+        return (self.yolo_ready and self.yolo_thread.model is not None
+                and self.yolo_thread.processing)
+
+    def _forward_frame_to_detector(self, frame):
+        """Runs on the capture thread: hand the frame to the detection
+        thread without a queued-signal round trip through the event loop"""
+        if self.yolo_ready and self.yolo_thread.model is not None and not self.paused:
+            self.yolo_thread.add_frame(frame)
+
+
     def update_peak_time_display(self):
         """Update peak and off-peak time displays and markers"""
-        # Peak time update
-        if self.peak_time_ms >= 0 and self.peak_count > 0: # Check count > 0
-            peak_hours = (self.peak_time_ms // 1000) // 3600
-            peak_minutes = ((self.peak_time_ms // 1000) % 3600) // 60
-            peak_seconds = (self.peak_time_ms // 1000) % 60
+        # Peak time update (skipped when the timestamp hasn't moved)
+        if self.peak_time_ms >= 0 and self.peak_count > 0 and self.peak_time_ms != self._last_peak_ms:
+            self._last_peak_ms = self.peak_time_ms
+            total_s = self.peak_time_ms // 1000
+            peak_hours, rem = divmod(total_s, 3600)
+            peak_minutes, peak_seconds = divmod(rem, 60)
             peak_time_str = f"{peak_hours:02d}:{peak_minutes:02d}:{peak_seconds:02d}"
             self.peak_time_value.setText(peak_time_str)
             self.peak_count_value.setText(f"({self.peak_count} people)")
-
-            # Update peak marker on graph
-            if self.people_data: # Check if graph data exists
-                 peak_time_sec = self.peak_time_ms / 1000.0
-                 if self.peak_marker is None:
-                      self.peak_marker = self.people_graph_plot_widget.plot(
-                           [peak_time_sec], [self.peak_count],
-                           pen=None, symbol='o', symbolSize=10,
-                           symbolBrush='#FF5555' # Red
-                      )
-                 else:
-                      self.peak_marker.setData([peak_time_sec], [self.peak_count])
+            # Marker repaint is deferred to the 10 Hz graph flush
+            self._markers_dirty = True
 
         # Off-peak time update
-        if self.offpeak_time_ms >= 0 and self.offpeak_count < float('inf'): # Check if valid count found
-            offpeak_hours = (self.offpeak_time_ms // 1000) // 3600
-            offpeak_minutes = ((self.offpeak_time_ms // 1000) % 3600) // 60
-            offpeak_seconds = (self.offpeak_time_ms // 1000) % 60
+        if self.offpeak_time_ms >= 0 and self.offpeak_count >= 0 and self.offpeak_time_ms != self._last_offpeak_ms:
+            self._last_offpeak_ms = self.offpeak_time_ms
+            total_s = self.offpeak_time_ms // 1000
+            offpeak_hours, rem = divmod(total_s, 3600)
+            offpeak_minutes, offpeak_seconds = divmod(rem, 60)
             offpeak_time_str = f"{offpeak_hours:02d}:{offpeak_minutes:02d}:{offpeak_seconds:02d}"
             self.offpeak_time_value.setText(offpeak_time_str)
             self.offpeak_count_value.setText(f"({self.offpeak_count} people)")
+            self._markers_dirty = True
 
-            # Update off-peak marker on graph
-            if self.people_data: # Check if graph data exists
-                 offpeak_time_sec = self.offpeak_time_ms / 1000.0
-                 if self.offpeak_marker is None:
-                      self.offpeak_marker = self.people_graph_plot_widget.plot(
-                           [offpeak_time_sec], [self.offpeak_count],
-                           pen=None, symbol='o', symbolSize=10,
-                           symbolBrush='#5599FF' # Blue
-                      )
-                 else:
-                      self.offpeak_marker.setData([offpeak_time_sec], [self.offpeak_count])
 
+    def _update_extreme_markers(self):
+        """Redraw the peak/off-peak graph markers (called from the 10 Hz
+        flush so marker repaints coalesce with the curve redraw)"""
+        if self.peak_count > 0:
+             self.peak_marker.setData([self.peak_time_ms / 1000.0], [self.peak_count])
+
+        if self.offpeak_count >= 0:
+             self.offpeak_marker.setData([self.offpeak_time_ms / 1000.0], [self.offpeak_count])
 
-    def display_detection_results(self, processed_frame_with_boxes, people_count, boxes):
+
+    def display_detection_results(self):
         """Display frame processed by YOLO, update counts, graph, heatmap, etc."""
+        # Pull the latest result from the detection thread's shared slot;
+        # queued emissions that piled up collapse into one pull (latest wins)
+        result = self.yolo_thread.take_latest_result()
+        if result is None:
+            return
+        processed_frame_with_boxes, people_count, boxes = result
+
         # Note: processed_frame_with_boxes already has boxes drawn by YOLO thread
         if processed_frame_with_boxes is None:
             return
 
-        # Store the last detected boxes for use when toggling heatmap while paused
-        self.last_detected_boxes = boxes.copy()
-
-        # Add current raw count to history for smoothing
-        self.people_count_history.append(people_count)
+        # Store the last detected boxes for use when toggling heatmap while
+        # paused. The detection thread builds a fresh list per frame and never
+        # touches it after publishing, so holding the reference is safe
+        self.last_detected_boxes = boxes
 
-        # Calculate smoothed people count (moving average)
-        if len(self.people_count_history) > 0:
-            new_smoothed_count = round(np.mean(self.people_count_history))
-        else:
-            new_smoothed_count = people_count # Should not happen if history is appended first
+        # Add current raw count to history; the running sum keeps the
+        # moving average O(1) instead of re-reducing the window every frame
+        previous_smoothed = self.smoothed_people_count
+        self._push_people_count(people_count)
 
-        # Update internal state only if smoothed count changes
         # This prevents unnecessary UI updates if count is stable
-        smoothed_count_changed = (new_smoothed_count != self.smoothed_people_count)
-        self.smoothed_people_count = new_smoothed_count
+        smoothed_count_changed = (self.smoothed_people_count != previous_smoothed)
 
-        # Update people count display
-        # Always update display text even if value is same, in case style needs resetting (e.g. after alert)
-        self.people_count_value.setText(str(self.smoothed_people_count))
-        # Reset style if not in alert state
-        if not self.threshold_alert_active:
-             self.people_count_value.setStyleSheet(LARGE_VALUE_FONT_STYLE)
+        # Update people count display only when the value moved: setText
+        # triggers label relayout/repaint, and the alert<->normal style swap
+        # is owned by update_crowd_alert_status, which already applies the
+        # interned stylesheet exactly once per state transition
+        if smoothed_count_changed:
+             self.people_count_value.setText(str(self.smoothed_people_count))
 
 
         # Check for threshold crossing if crowd detection is enabled
@@ -2274,8 +2519,11 @@ class CrowdSenseApp(QMainWindow):
             self.peak_time_ms = self.video_time_ms
             self.update_peak_time_display()
 
-        # Track off-peak only if count is positive and lower than current off-peak
-        if self.smoothed_people_count > 0 and self.smoothed_people_count < self.offpeak_count:
+        # Track off-peak only if count is positive and lower than current
+        # off-peak; -1 means no off-peak has been recorded yet. Pure int
+        # comparisons here, mixed int/float against inf is slower in CPython
+        if self.smoothed_people_count > 0 and (
+                self.offpeak_count < 0 or self.smoothed_people_count < self.offpeak_count):
             self.offpeak_count = self.smoothed_people_count
             self.offpeak_time_ms = self.video_time_ms
             self.update_peak_time_display()
@@ -2290,15 +2538,26 @@ class CrowdSenseApp(QMainWindow):
         final_display_frame = self.process_frame_with_heatmap(processed_frame_with_boxes, boxes)
 
         if final_display_frame is not None:
-             # Store the final frame that includes heatmap/alerts
-             self.displayed_frame = final_display_frame.copy()
+             # Store the final frame that includes heatmap/alerts; the
+             # persistent display buffer keeps it valid until the next frame
+             self.displayed_frame = final_display_frame
+
+             # Display the processed frame (BGR, no conversion needed)
+             self.display_frame(final_display_frame)
 
-             # Convert to RGB for display
-             rgb_frame = cv2.cvtColor(final_display_frame, cv2.COLOR_BGR2RGB)
 
-             # Display the processed frame
-             self.display_frame(rgb_frame)
 
+    def _push_people_count(self, count):
+        """Append a raw count to the smoothing window, maintaining a running
+        sum so the moving average costs O(1) per frame instead of O(window)"""
+        history = self.people_count_history
+        if len(history) == history.maxlen:
+            self._history_sum -= history[0]
+        history.append(count)
+        self._history_sum += count
+        # Rounded integer divide: stays in int arithmetic, no float round-trip
+        n = len(history)
+        self.smoothed_people_count = (self._history_sum + n // 2) // n
 
     def check_threshold_crossing(self, frame):
         """Check if smoothed people count exceeds threshold and update alert status."""
@@ -2311,16 +2570,27 @@ class CrowdSenseApp(QMainWindow):
              # No need to redraw frame here, display_detection_results handles it
 
 
-    def display_frame(self, rgb_frame):
-        """Display a video frame in the video_label, scaling it correctly."""
-        if rgb_frame is None or not hasattr(self, 'video_label') or not self.video_label.isVisible():
+    def display_frame(self, bgr_frame):
+        """Display a video frame in the video_label, scaling it correctly.
+
+        Takes the frame in OpenCV's native BGR order: Format_BGR888 lets Qt
+        read the buffer directly, so no per-frame channel swap is needed.
+        """
+        if bgr_frame is None or not hasattr(self, 'video_label') or not self.video_label.isVisible():
              # print("Debug: Skipping display_frame (no frame or label not ready)")
              return # Don't process if no frame or label isn't ready
 
         try:
-            h, w, ch = rgb_frame.shape
+            h, w, ch = bgr_frame.shape
             bytes_per_line = ch * w
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+
+            # Reuse the QImage wrapper across frames; it only needs rebuilding
+            # when the backing buffer is reallocated (resolution change)
+            if self._qimage_buffer is not bgr_frame:
+                self._qimage = QImage(bgr_frame.data, w, h, bytes_per_line,
+                                      QImage.Format.Format_BGR888)
+                self._qimage_buffer = bgr_frame
+            qt_image = self._qimage
 
             # Get the current size of the video label
             label_size = self.video_label.size()
@@ -2333,7 +2603,7 @@ class CrowdSenseApp(QMainWindow):
             pixmap = QPixmap.fromImage(qt_image)
             scaled_pixmap = pixmap.scaled(label_size,
                                           Qt.AspectRatioMode.KeepAspectRatio,
-                                          Qt.TransformationMode.SmoothTransformation)
+                                          self._scale_mode)
 
             # Hide the default content (icon/text) widgets before showing video
             # This check might only be needed once, could be optimized
@@ -2357,16 +2627,24 @@ class CrowdSenseApp(QMainWindow):
         """Handle window resize events, redraw current frame."""
         super().resizeEvent(event)
 
+        # Keep the alert overlay matched to the video label
+        if self.alert_overlay.isVisible():
+            self.alert_overlay.setGeometry(self.video_label.rect())
+
         # Redraw the currently displayed frame (could be raw or processed)
         # Use self.displayed_frame as it represents what *should* be shown
         if self.displayed_frame is not None:
+            # The held frame stays on screen until the next decode, so spend
+            # the bilinear scale here and keep the fast path for playback
+            self._scale_mode = Qt.TransformationMode.SmoothTransformation
             try:
-                 rgb_frame = cv2.cvtColor(self.displayed_frame, cv2.COLOR_BGR2RGB)
-                 self.display_frame(rgb_frame)
+                 self.display_frame(self.displayed_frame)
             except cv2.error as e:
                  print(f"CV2 Error during resize redraw: {e}")
             except Exception as e:
                  print(f"Error during resize redraw: {e}")
+            finally:
+                 self._scale_mode = Qt.TransformationMode.FastTransformation
         elif self.cap is None: # If no video loaded, ensure default content is shown
              self.video_label.set_default_content()
 
@@ -2421,7 +2699,7 @@ class CrowdSenseApp(QMainWindow):
              return
 
         # Check if we have graph data
-        if not self.time_data or not self.people_data:
+        if self._graph_n == 0:
             self.show_export_error_message("No graph data available to export.")
             return
 
@@ -2452,14 +2730,19 @@ class CrowdSenseApp(QMainWindow):
                   return
 
 
-        # Create a high-resolution figure
+        # Build the figure once and reuse it across exports; matplotlib's
+        # Figure/Canvas construction is the slow part of a cold export
         try:
-             fig = Figure(figsize=(12, 7), dpi=150) # Slightly larger figure
-             canvas = FigureCanvas(fig)
-             ax = fig.add_subplot(111)
+             if self._export_fig is None:
+                  fig = Figure(figsize=(12, 7), dpi=150) # Slightly larger figure
+                  canvas = FigureCanvas(fig)
+                  ax = fig.add_subplot(111)
+                  self._export_fig = (fig, canvas, ax)
+             fig, canvas, ax = self._export_fig
+             ax.clear()
 
              # Plot the data with styling
-             ax.plot(list(self.time_data), list(self.people_data),
+             ax.plot(self.time_data[:self._graph_n], self.people_data[:self._graph_n],
                      marker='o', markersize=4, linewidth=2, color=ACCENT_COLOR, label='People Count')
 
              # Add threshold line if it was enabled
@@ -2467,9 +2750,9 @@ class CrowdSenseApp(QMainWindow):
                   ax.axhline(y=self.crowd_size_threshold, color='r', linestyle='--', linewidth=1, label=f'Threshold ({self.crowd_size_threshold})')
 
              # Add peak/off-peak markers if they exist
-             if self.peak_marker is not None and self.peak_count > 0:
+             if self.peak_count > 0:
                   ax.plot(self.peak_time_ms / 1000.0, self.peak_count, 'o', markersize=8, color='#FF5555', label=f'Peak ({self.peak_count})')
-             if self.offpeak_marker is not None and self.offpeak_count < float('inf'):
+             if self.offpeak_count >= 0:
                    ax.plot(self.offpeak_time_ms / 1000.0, self.offpeak_count, 'o', markersize=8, color='#5599FF', label=f'Off-Peak ({self.offpeak_count})')
 
 
@@ -2494,7 +2777,7 @@ class CrowdSenseApp(QMainWindow):
              ax.tick_params(axis='y', colors=MUTED_TEXT_COLOR)
 
              # Add legend if threshold or markers were added
-             if self.crowd_detection_enabled or self.peak_marker or self.offpeak_marker:
+             if self.crowd_detection_enabled or self.peak_count > 0 or self.offpeak_count >= 0:
                   legend = ax.legend()
                   plt.setp(legend.get_texts(), color=MUTED_TEXT_COLOR) # Style legend text
                   legend.get_frame().set_facecolor(WIDGET_BG_COLOR)
@@ -2514,10 +2797,8 @@ class CrowdSenseApp(QMainWindow):
         except Exception as e:
              print(f"Error during graph export: {e}")
              self.show_export_error_message(f"Failed to export graph:\n{e}")
-        finally:
-             # Ensure matplotlib figure is closed to release memory
-             if 'fig' in locals():
-                  plt.close(fig)
+        # No plt.close here: the figure was built via Figure(), so pyplot
+        # never registered it, and it is deliberately kept for the next export
 
 
 
@@ -2564,35 +2845,33 @@ class CrowdSenseApp(QMainWindow):
                   return
 
         try:
-             # Create a normalized version of the aggregate heatmap
-             # Normalize by the max value in the aggregate heatmap for better contrast
-             aggregate_norm = self.aggregate_heatmap_accumulator.copy()
-             max_aggr_val = np.max(aggregate_norm)
+             # Normalize and quantize in one fused pass at accumulator
+             # resolution: convertScaleAbs does scale+clip+uint8 together, so
+             # the float work happens on the tiny low-res grid and everything
+             # downstream moves 1 byte per pixel instead of 4
+             aggregate_f32 = self.aggregate_heatmap_accumulator.astype(np.float32)
+             max_aggr_val = float(aggregate_f32.max())
 
              if max_aggr_val > 0:
-                  aggregate_norm /= max_aggr_val
+                  alpha = 255.0 / max_aggr_val
              else:
+                  alpha = 0.0
                   print("Warning: Aggregate heatmap has no intensity.")
                   # Result will be black or just the background frame
+             heatmap_8bit_small = cv2.convertScaleAbs(aggregate_f32, alpha=alpha)
 
-             # Upsample normalized aggregate heatmap to original frame size
-             heatmap_resized = cv2.resize(aggregate_norm, (w, h), interpolation=cv2.INTER_LINEAR)
-
-             # Apply additional blur for smoother visualization (optional, but can look better)
-             heatmap_blurred = cv2.GaussianBlur(heatmap_resized, (21, 21), 0) # Kernel size adjustable
-
-             # Convert blurred heatmap to colormap
-             # Ensure values are clipped between 0 and 1 before scaling to 255
-             heatmap_clipped = np.clip(heatmap_blurred, 0, 1)
-             heatmap_8bit = (heatmap_clipped * 255).astype(np.uint8)
+             # Upsample the uint8 heatmap to frame size, then smooth
+             heatmap_resized = cv2.resize(heatmap_8bit_small, (w, h), interpolation=cv2.INTER_LINEAR)
+             heatmap_8bit = cv2.GaussianBlur(heatmap_resized, (21, 21), 0) # Kernel size adjustable
              heatmap_colored = cv2.applyColorMap(heatmap_8bit, cv2.COLORMAP_JET)
 
-             # Create a background using the last displayed frame if available, else black
+             # Blend over the last displayed frame if available, else export
+             # the bare heatmap. The background dimming is folded into the
+             # blend weight (0.4 dim x 0.3 blend = 0.12), which drops the
+             # zeros_like allocation and one full-frame addWeighted pass
              if self.displayed_frame is not None:
-                 background = cv2.addWeighted(self.displayed_frame, 0.4, np.zeros_like(self.displayed_frame), 0.6, 0)
-                 result = cv2.addWeighted(heatmap_colored, 0.7, background, 0.3, 0) # Blend heatmap over background
+                 result = cv2.addWeighted(heatmap_colored, 0.7, self.displayed_frame, 0.12, 0)
              else:
-                 # Fallback to just the colored heatmap if no background frame
                  result = heatmap_colored
 
              # Save the result
@@ -1,14 +1,48 @@
 import sys
 import os
+from collections import deque
+
 import cv2
 import torch
 import numpy as np
-import urllib.request
 import time
 
-from PyQt6.QtCore import QThread, pyqtSignal
+import requests
+from requests.adapters import HTTPAdapter
+
+from PyQt6.QtCore import QThread, QMutex, QWaitCondition, pyqtSignal
 from ultralytics import YOLO, RTDETR
 
+# Shared session so repeated model downloads (user switching sizes) reuse the
+# TLS connection instead of paying a fresh handshake per file
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+def open_video_capture(file_path):
+    """Open a video file, preferring GStreamer hardware decode when available.
+
+    On NVIDIA systems with a GStreamer-enabled OpenCV build, H.264 sources in
+    mp4/mov containers decode on the GPU via nvv4l2decoder instead of eating
+    CPU cycles. Anything else (or a failed pipeline) falls back to the
+    default backend.
+    """
+    if file_path.lower().endswith((".mp4", ".mov")):
+        gst_pipeline = (
+            f"filesrc location={file_path} ! qtdemux ! h264parse ! "
+            "nvv4l2decoder ! nvvidconv ! video/x-raw,format=BGRx ! "
+            "videoconvert ! video/x-raw,format=BGR ! appsink"
+        )
+        try:
+            cap = cv2.VideoCapture(gst_pipeline, cv2.CAP_GSTREAMER)
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except Exception:
+            pass
+
+    return cv2.VideoCapture(file_path)
+
+
 class ModelDownloadThread(QThread):
     """Thread for downloading YOLO models"""
     progress_update = pyqtSignal(int, str)  # Progress percentage, message
@@ -34,15 +68,39 @@ class ModelDownloadThread(QThread):
             self.download_complete.emit(False, "")
 
     def download_with_progress(self, url, save_path):
-        """Download a file with progress reporting"""
-
-        def progress_callback(count, block_size, total_size):
-            if total_size > 0:
-                percentage = min(int(count * block_size * 100 / total_size), 100)
-                self.progress_update.emit(percentage, f"Downloading {self.model_name}: {percentage}%")
-
+        """Download a file to disk with progress reporting."""
         self.progress_update.emit(0, f"Starting download of {self.model_name}...")
-        urllib.request.urlretrieve(url, save_path, progress_callback)
+        with open(save_path, "wb") as f:
+            self._download_to(url, f)
+
+    def _download_to(self, url, sink):
+        """Stream a URL into `sink` - an open binary file or a bytearray.
+
+        Streams 1 MiB chunks over the shared session - far fewer syscalls
+        than urlretrieve's 8 KiB blocks for multi-hundred-MB weights, and the
+        pooled connection survives across downloads - emitting progress only
+        when the integer percentage actually changes, so the UI sees ~100
+        signals per download instead of thousands.
+
+        Model weights always stream straight to disk; the bytearray sink is
+        for small assets (config files, class lists) where extend() keeps
+        accumulation linear instead of the quadratic bytes-concat pattern.
+        """
+        write = sink.extend if isinstance(sink, bytearray) else sink.write
+        written = 0
+        last_percentage = -1
+
+        with _session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            total_size = int(response.headers.get("Content-Length", 0))
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                write(chunk)
+                written += len(chunk)
+                if total_size > 0:
+                    percentage = min(written * 100 // total_size, 100)
+                    if percentage != last_percentage:
+                        last_percentage = percentage
+                        self.progress_update.emit(percentage, f"Downloading {self.model_name}: {percentage}%")
 
 class VideoFrameThread(QThread):
     """Separate thread for handling video frames to prevent UI slowdowns"""
@@ -55,9 +113,39 @@ class VideoFrameThread(QThread):
         self.running = False
         self.paused = False
         self.loop_detected = False
+        # Two reusable decode buffers: the capture decodes into alternating
+        # slots so the detector can copy out of one while the next decode is
+        # in flight. Consumers that keep frames longer than that (the GUI)
+        # are handed a snapshot at emit time, never the pooled buffer
+        self._buffers = [None, None]
+        self._slot = 0
+        self._target_ms = 30  # Per-frame budget, matched to the source in set_capture
+        # Optional direct handoff to the detection thread: a plain call from
+        # this thread, skipping the per-emission event allocation a queued
+        # Qt signal would pay. The signal below remains for the GUI, which
+        # must cross into the event loop
+        self.frame_consumer = None
+        # Optional callable returning True while the detector is mid-batch;
+        # used to skip the decode half of a read when the frame would just
+        # be trimmed from the detection backlog anyway
+        self.detector_busy = None
+        # Cumulative count of grab-skipped frames. They advance the stream
+        # without a frame_ready emission, so the GUI folds the delta into
+        # its video-clock increment on the next frame it does receive
+        self.skipped_grabs = 0
 
     def set_capture(self, cap):
         self.cap = cap
+        self.skipped_grabs = 0
+        # Pace reads to the source frame rate instead of a fixed 30 ms: a
+        # fixed sleep drops frames from faster sources and oversleeps slow
+        # ones. Webcams often report 0/NaN FPS; use a short sleep there and
+        # let the camera's own buffering gate the loop
+        fps = cap.get(cv2.CAP_PROP_FPS) if cap is not None else 0
+        if fps and fps > 0:
+            self._target_ms = max(1, int(1000 / fps))
+        else:
+            self._target_ms = 5
 
     def stop(self):
         self.running = False
@@ -72,9 +160,36 @@ class VideoFrameThread(QThread):
         # For local videos or webcams
         while self.running and self.cap is not None and self.cap.isOpened():
             if not self.paused:
-                ret, frame = self.cap.read()
+                t0 = time.perf_counter()
+                busy = self.detector_busy
+                if busy is not None and busy():
+                    # Detection is mid-batch: advance the stream with a
+                    # cheap grab() (demux only) and skip the 5-15 ms decode
+                    # a retrieve() would cost, since the frame would be
+                    # dropped from the backlog before inference anyway
+                    ret = self.cap.grab()
+                    frame = None
+                    if ret:
+                        self.skipped_grabs += 1
+                else:
+                    self._slot ^= 1
+                    buf = self._buffers[self._slot]
+                    if buf is not None:
+                        # Decode straight into the pooled buffer
+                        ret, frame = self.cap.read(buf)
+                    else:
+                        ret, frame = self.cap.read()
                 if ret:
-                    self.frame_ready.emit(frame)
+                    if frame is not None:
+                        self._buffers[self._slot] = frame
+                        consumer = self.frame_consumer
+                        if consumer is not None:
+                            consumer(frame)
+                        # The GUI slot runs later via the queued connection
+                        # and retains the frame indefinitely, so it gets a
+                        # snapshot; the pooled buffer is only stable until
+                        # the next-but-one read overwrites it
+                        self.frame_ready.emit(frame.copy())
                 else:
                     # Video ended - don't automatically restart
                     # Just emit the end-of-video signal
@@ -83,41 +198,162 @@ class VideoFrameThread(QThread):
                     # Otherwise it keeps trying to read from a finished source
                     self.running = False
 
-            # Sleep to control frame rate
-            self.msleep(30)  # ~33 fps
+                # Sleep only for what remains of this frame's budget, so
+                # decode time doesn't stretch the effective frame interval
+                elapsed_ms = int((time.perf_counter() - t0) * 1000)
+                self.msleep(max(0, self._target_ms - elapsed_ms))
+            else:
+                self.msleep(self._target_ms)
 
 class YoloDetectionThread(QThread):
     """Separate thread for YOLO detection to prevent UI slowdowns"""
-    detection_ready = pyqtSignal(object, int, list)  # Frame, count, boxes
+    # Parameter-less on purpose: the result tuple is published to a
+    # lock-protected slot and pulled by the receiver, so large ndarrays are
+    # never boxed into QVariants for queued delivery
+    detection_ready = pyqtSignal()
     model_loaded = pyqtSignal(bool, str)  # Success, message
 
     def __init__(self, model_path="yolov8n.pt"):
         super().__init__()
-        self.frame_queue = []
+        # Bounded queue: when detection falls behind, the oldest frames are
+        # dropped automatically and one batched forward pass drains the rest.
+        # The worker blocks on the condition variable instead of polling
+        self.frame_queue = deque(maxlen=4)
+        self._queue_mutex = QMutex()
+        self._queue_cv = QWaitCondition()
         self.running = False
         self.model = None
         self.model_path = model_path
         self.processing = False
         self.loading_model = False
         self.confidence_threshold = 0.4  # Default threshold
+        self.imgsz = 640  # Inference resolution; frames are letterboxed to this
+        # FP16 inference on CUDA: tensor cores give ~2x throughput and the
+        # export path already prefers an FP16 TensorRT engine anyway; CPU
+        # inference stays FP32 (or the INT8 OpenVINO export when present)
+        self._use_half = torch.cuda.is_available()
+        # Latest-result slot shared with the GUI thread (see detection_ready)
+        self._latest_result = None
+        self._result_lock = QMutex()
+        # Change gate: a 64x36 thumbnail of the last frame that went through
+        # the model, plus the tuple published for it. Visually static
+        # intervals (idle webcams) republish that tuple instead of paying a
+        # forward pass
+        self._prev_small = None
+        self._prev_publish = None
+        self.static_diff_threshold = 2.0  # mean abs diff (uint8) treated as "unchanged"
 
     def set_model_path(self, model_path):
         """Set a new model path and reset the model"""
         self.model_path = model_path
         self.model = None
+        self._reset_static_gate()
 
     def add_frame(self, frame):
-        if frame is not None and not self.processing:
-            self.frame_queue = [frame.copy()]  # Only keep the latest frame
+        if frame is not None:
+            # Copy out of the capture thread's buffer pool, then wake the
+            # worker if it is blocked waiting for work
+            self._queue_mutex.lock()
+            self.frame_queue.append(frame.copy())
+            self._queue_cv.wakeOne()
+            self._queue_mutex.unlock()
+
+    def clear_queue(self):
+        """Drop any pending frames. Runs on the GUI thread, so it takes the
+        queue mutex: a bare clear() could land between the worker's
+        truthiness check and its popleft() and raise inside run()"""
+        self._queue_mutex.lock()
+        self.frame_queue.clear()
+        self._queue_mutex.unlock()
 
     def set_confidence_threshold(self, threshold):
         """Set the confidence threshold for detections"""
         self.confidence_threshold = threshold
+        self._reset_static_gate()
+
+    def _reset_static_gate(self):
+        """Invalidate the unchanged-frame gate. Called whenever detection
+        parameters change: the cached result was computed with the old
+        model/threshold, so an identical-looking frame must still be
+        re-inferred rather than served from the stale publish"""
+        self._prev_small = None
+        self._prev_publish = None
 
     def stop(self):
         self.running = False
+        # Wake the worker in case it is blocked waiting for frames
+        self._queue_mutex.lock()
+        self._queue_cv.wakeAll()
+        self._queue_mutex.unlock()
         self.wait()
 
+    def take_latest_result(self):
+        """Swap out the most recent (frame, count, boxes) result, or None"""
+        self._result_lock.lock()
+        result = self._latest_result
+        self._latest_result = None
+        self._result_lock.unlock()
+        return result
+
+    def _resolve_accelerated_weights(self, model_path):
+        """Prefer a TensorRT FP16 engine over eager PyTorch on CUDA machines.
+
+        The .pt checkpoint is exported once to a .engine file cached next to
+        it; subsequent loads pick the engine up directly. Export failures
+        (no TensorRT, no GPU) fall back to the original checkpoint.
+        """
+        if not model_path.endswith(".pt"):
+            return model_path
+
+        engine_path = model_path[:-3] + ".engine"
+        if os.path.exists(engine_path):
+            return engine_path
+
+        if not torch.cuda.is_available():
+            # CPU-only deployment: prefer an INT8 OpenVINO export, which uses
+            # the x86 int8 dot-product instructions instead of FP32 convs
+            ov_path = model_path[:-3] + "_int8_openvino_model"
+            if os.path.isdir(ov_path):
+                return ov_path
+
+            # A cached ONNX export from an earlier run where OpenVINO was
+            # unavailable is still better than eager PyTorch
+            onnx_path = model_path[:-3] + ".onnx"
+            if os.path.exists(onnx_path):
+                return onnx_path
+
+            try:
+                print(f"Quantizing {model_path} to INT8 via OpenVINO (one-off)...")
+                YOLO(model_path).export(format="openvino", int8=True)
+                if os.path.isdir(ov_path):
+                    return ov_path
+            except Exception as e:
+                print(f"OpenVINO INT8 export failed: {e}")
+
+            # Second choice: plain ONNX. Ultralytics loads it through ONNX
+            # Runtime's fused CPU kernels with graph optimizations enabled,
+            # dropping the torch eager-mode overhead while keeping the same
+            # Results interface the detection loop consumes
+            try:
+                print(f"Exporting {model_path} to ONNX (one-off)...")
+                YOLO(model_path).export(format="onnx", opset=13, simplify=True)
+                if os.path.exists(onnx_path):
+                    return onnx_path
+            except Exception as e:
+                print(f"ONNX export failed, using PyTorch weights: {e}")
+
+            return model_path
+
+        try:
+            print(f"Exporting {model_path} to a TensorRT FP16 engine (one-off)...")
+            YOLO(model_path).export(format="engine", half=True, device=0)
+            if os.path.exists(engine_path):
+                return engine_path
+        except Exception as e:
+            print(f"TensorRT export failed, using PyTorch weights: {e}")
+
+        return model_path
+
     def load_model(self):
         """Load YOLO or RT-DETR model"""
         if self.loading_model:
@@ -125,15 +361,21 @@ class YoloDetectionThread(QThread):
 
         self.loading_model = True
 
+        if torch.cuda.is_available():
+            # Input size is fixed per model, so let cuDNN benchmark once and
+            # reuse the fastest convolution kernels for every frame after
+            torch.backends.cudnn.benchmark = True
+
         try:
             # Check if the filename contains "rtdetr" to determine which class to use
             if "rtdetr" in self.model_path.lower():
                 print(f"Loading RT-DETR model: {self.model_path}")
                 self.model = RTDETR(self.model_path)
             else:
-                print(f"Loading YOLO model: {self.model_path}")
-                self.model = YOLO(self.model_path)
-                
+                load_path = self._resolve_accelerated_weights(self.model_path)
+                print(f"Loading YOLO model: {load_path}")
+                self.model = YOLO(load_path)
+
             self.model_loaded.emit(True, f"Model loaded successfully from {self.model_path}")
         except Exception as e:
             error_msg = f"Error loading model: {e}"
@@ -150,45 +392,94 @@ class YoloDetectionThread(QThread):
             self.load_model()
 
         while self.running:
-            if len(self.frame_queue) > 0 and self.model is not None:
+            # Block until the capture thread hands over work: a condition
+            # wait costs nothing while idle and wakes immediately on
+            # add_frame, instead of the old 10 ms polling sleep
+            self._queue_mutex.lock()
+            while self.running and len(self.frame_queue) == 0:
+                self._queue_cv.wait(self._queue_mutex)
+
+            # Drain everything queued so far and run one batched forward
+            # pass; fixed per-call overhead is amortized across the batch
+            batch = []
+            while self.frame_queue:
+                batch.append(self.frame_queue.popleft())
+            self._queue_mutex.unlock()
+
+            if batch and self.model is not None:
                 self.processing = True
-                frame = self.frame_queue.pop(0)
 
-                try:
-                    # Run YOLO detection on the frame
-                    results = self.model(frame, classes=0)  # Class 0 is 'person' in COCO dataset
-
-                    people_count = 0
-                    boxes = []
+                # Gate on the newest frame: a downsampled mean absolute
+                # difference costs ~2 kB of work against a model forward
+                # pass. Below the threshold the scene hasn't changed, so the
+                # previous result is republished as-is (older frames in the
+                # batch are intermediates and would be superseded anyway)
+                small = cv2.resize(batch[-1], (64, 36), interpolation=cv2.INTER_AREA)
+                if (self._prev_small is not None
+                        and self._prev_publish is not None
+                        and cv2.absdiff(small, self._prev_small).mean() < self.static_diff_threshold):
+                    self._result_lock.lock()
+                    self._latest_result = self._prev_publish
+                    self._result_lock.unlock()
+                    self.detection_ready.emit()
+                    self.processing = False
+                    continue
+                self._prev_small = small
 
-                    for result in results:
+                try:
+                    # Run YOLO detection on the batch. Class 0 is 'person' in
+                    # the COCO dataset; confidence filtering happens inside
+                    # the model's vectorized postprocess via conf=, so every
+                    # returned box is already above threshold
+                    # stream=True yields Results lazily while the loop below
+                    # consumes them, instead of materializing the whole list
+                    results = self.model(batch, classes=0,
+                                         conf=self.confidence_threshold,
+                                         imgsz=self.imgsz,
+                                         stream=True,
+                                         half=self._use_half,
+                                         verbose=False)
+
+                    for frame, result in zip(batch, results):
                         result_boxes = result.boxes
-                        for box in result_boxes:
-                            # Get box coordinates
-                            x1, y1, x2, y2 = box.xyxy[0].tolist()
-                            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-                            confidence = float(box.conf[0])
-
-                            if confidence > self.confidence_threshold:
+                        if len(result_boxes) > 0:
+                            # Two bulk device-to-host copies instead of
+                            # per-box tensor indexing (each box.xyxy[0]
+                            # access walks the tensor machinery); conf=
+                            # already filtered, so no mask pass is needed
+                            xyxy = result_boxes.xyxy.cpu().numpy().astype(np.int32)
+                            confs = result_boxes.conf.cpu().numpy()
+                            # Store box coordinates for heatmap
+                            boxes = list(map(tuple, xyxy.tolist()))
+
+                            color = (0, 255, 0)  # Green
+                            for (x1, y1, x2, y2), confidence in zip(boxes, confs):
                                 # Draw bounding box
-                                color = (0, 255, 0)  # Green
                                 cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
-
-                                conf_text = f"{confidence:.2f}"
-                                cv2.putText(frame, conf_text, (x1, y1-5),
+                                cv2.putText(frame, f"{confidence:.2f}", (x1, y1-5),
                                             cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+                        else:
+                            boxes = []
 
-                                # Store box coordinates for heatmap
-                                boxes.append((x1, y1, x2, y2))
-
-                                people_count += 1
+                        people_count = len(boxes)
 
-                    # Emit the processed frame, people count, and boxes for heatmap
-                    self.detection_ready.emit(frame, people_count, boxes)
+                        # Publish the result under the lock and wake the GUI
+                        # with a lightweight signal; the slot pulls the tuple
+                        self._result_lock.lock()
+                        self._latest_result = self._prev_publish = (frame, people_count, boxes)
+                        self._result_lock.unlock()
+                        self.detection_ready.emit()
 
                 except Exception as e:
                     print(f"Error in YOLO detection: {e}")
 
                 self.processing = False
 
-            self.msleep(10)
+                # If the queue refilled while this batch ran, detection is
+                # lagging the source; keep only the newest frame so the next
+                # batch starts from fresh data instead of a stale backlog
+                self._queue_mutex.lock()
+                if len(self.frame_queue) == self.frame_queue.maxlen:
+                    while len(self.frame_queue) > 1:
+                        self.frame_queue.popleft()
+                self._queue_mutex.unlock()
@@ -9,11 +9,15 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QComboBox, QPushButton,
                              QFrame, QSizePolicy, QFileDialog, QProgressBar, QSlider, QCheckBox, QDialog, QSplitter, QScrollArea, QGridLayout)
 from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QSize, QThread, pyqtSignal, pyqtProperty, QRect, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QPixmap, QImage, QFont, QDragEnterEvent, QDropEvent, QPainter, QPainterPath, QColor, QPen, QFontMetrics
+from PyQt6.QtGui import QPixmap, QImage, QFont, QDragEnterEvent, QDropEvent, QPainter, QPainterPath, QColor, QPen, QBrush, QFontMetrics
 from PyQt6.QtSvg import QSvgRenderer
 
 from config import *
 
+# Resolved once at import: set_default_content used to rebuild this path
+# (and re-stat it) on every return to the idle state
+_SVG_PATH = os.path.join(os.getcwd(), "assets", "video-upload.svg")
+
 class ToggleSwitch(QWidget):
     """Modern toggle switch widget"""
 
@@ -27,6 +31,14 @@ class ToggleSwitch(QWidget):
         self.checked = False
         self.thumb_position = 2  # Initial position
 
+        # Colors built once; paintEvent runs on every toggle/hover repaint
+        self._track_disabled = QColor('#3E3E42')  # Gray for disabled
+        self._thumb_disabled = QColor('#888888')  # Light gray for disabled thumb
+        self._track_on = QColor(ACCENT_COLOR)
+        self._track_off = QColor(BORDER_COLOR)
+        self._thumb_on = QColor('#FFFFFF')
+        self._thumb_off = QColor('#AAAAAA')
+
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
     def paintEvent(self, event):
@@ -39,12 +51,12 @@ class ToggleSwitch(QWidget):
 
         if not self.isEnabled():
             # Disabled state
-            track_color = QColor('#3E3E42')  # Gray for disabled
-            thumb_color = QColor('#888888')  # Light gray for disabled thumb
+            track_color = self._track_disabled
+            thumb_color = self._thumb_disabled
         else:
             # Enabled state
-            track_color = QColor(ACCENT_COLOR) if self.checked else QColor(BORDER_COLOR)
-            thumb_color = QColor('#FFFFFF') if self.checked else QColor('#AAAAAA')
+            track_color = self._track_on if self.checked else self._track_off
+            thumb_color = self._thumb_on if self.checked else self._thumb_off
 
         # Draw track
         painter.setPen(Qt.PenStyle.NoPen)
@@ -100,16 +112,41 @@ class ModernBoxedSlider(QWidget):
         self.pressed = False
         self.hover = False
         self.integer_display = integer_display
+
+        # Paint objects built once: a drag repaints at 60+ Hz, and
+        # constructing pens/brushes/fonts per paint is pure churn
+        self._pen_outline = QPen(QColor(BORDER_COLOR), 1)
+        self._brush_bg = QBrush(QColor(DROPDOWN_BG_COLOR))
+        self._brush_fill = QBrush(QColor(DARKER_ACCENT_COLOR))
+        self._brush_fill_hover = QBrush(QColor(ACCENT_COLOR))
+        self._pen_inner = QPen(QColor(LIGHTER_ACCENT_COLOR), 0.5)
+        self._pen_border = QPen(QColor(BORDER_COLOR), 2)
+        self._pen_border_hover = QPen(QColor(ACCENT_COLOR), 2)
+        self._pen_text = QPen(QColor(TEXT_COLOR))
+        self._font = QFont('Segoe UI', 14)
+
+        # Coalesce valueChanged emissions: a drag produces a setValue per
+        # pixel of motion, but downstream handlers only need the settled
+        # value at display rate. The repaint stays immediate; the signal
+        # fires once 16 ms after the last change (trailing edge)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._emit_value_changed)
+
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setMouseTracking(True)
 
+    def _emit_value_changed(self):
+        self.valueChanged.emit(self.value)
+
     def setValue(self, value):
         """Set slider value and emit change signal if needed"""
         value = max(self.minimum, min(self.maximum, value))
         if self.value != value:
             self.value = value
             self.update()  # Trigger repaint
-            self.valueChanged.emit(value)
+            self._emit_timer.start()
 
     def getValue(self):
         """Get current slider value"""
@@ -136,17 +173,16 @@ class ModernBoxedSlider(QWidget):
         filled_width = int(width * value_position)
 
         # Draw background (unfilled part)
-        painter.setPen(QPen(QColor(BORDER_COLOR), 1))
-        painter.setBrush(QColor(DROPDOWN_BG_COLOR))
+        painter.setPen(self._pen_outline)
+        painter.setBrush(self._brush_bg)
         painter.drawRoundedRect(0, 0, width, height, 4, 4)
 
         # Draw filled part
         if filled_width > 0:
             # Use lighter blue when hovered
-            fill_color = QColor(ACCENT_COLOR) if self.hover else QColor(DARKER_ACCENT_COLOR)
-            painter.setBrush(fill_color)
+            painter.setBrush(self._brush_fill_hover if self.hover else self._brush_fill)
 
-            painter.setPen(QPen(QColor(LIGHTER_ACCENT_COLOR), 0.5))
+            painter.setPen(self._pen_inner)
 
             # Create a rectangular path for the filled portion
             filled_rect = QRect(0, 0, filled_width, height)
@@ -164,8 +200,7 @@ class ModernBoxedSlider(QWidget):
                 painter.drawRoundedRect(0, 0, filled_width, height, 4, 4)
 
         # Draw border again to ensure it's visible
-        border_color = ACCENT_COLOR if self.hover else BORDER_COLOR
-        painter.setPen(QPen(QColor(border_color), 2))
+        painter.setPen(self._pen_border_hover if self.hover else self._pen_border)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRoundedRect(0, 0, width, height, 5, 5)
 
@@ -174,9 +209,8 @@ class ModernBoxedSlider(QWidget):
         else:
             value_text = f"{self.value / 100:.2f}"
 
-        painter.setPen(QColor(TEXT_COLOR))
-        font = QFont('Segoe UI', 14)
-        painter.setFont(font)
+        painter.setPen(self._pen_text)
+        painter.setFont(self._font)
         text_rect = QRect(0, 0, width, height)
         painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, value_text)
 
@@ -240,6 +274,13 @@ class ModernBoxedSlider(QWidget):
 class DragDropVideoLabel(QLabel):
     """Custom QLabel with drag and drop functionality for videos"""
 
+    # Rendered upload icon, shared across instances and reset cycles: the
+    # SVG is parsed and rasterized once instead of on every return-to-default.
+    # Misses are cached too (_default_pixmap_resolved) so a missing or broken
+    # SVG doesn't mean a filesystem stat per call.
+    _default_pixmap_cache = None
+    _default_pixmap_resolved = False
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
@@ -247,31 +288,25 @@ class DragDropVideoLabel(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.is_hovered = False
 
-        # Normal styling
-        self.normal_style = f"""
-            QLabel {{
+        # One stylesheet parsed once, keyed on a dynamic property: state
+        # changes just flip the property and re-polish, instead of handing
+        # Qt's CSS parser a fresh string on every hover/drag transition
+        self.setStyleSheet(f"""
+            QLabel[dropState="normal"] {{
                 {DEFAULT_FONT}
                 font-size: 14px;
                 color: {MUTED_TEXT_COLOR};
                 background-color: {DARK_BG_COLOR};
                 border-radius: 4px;
             }}
-        """
-
-        # Mouse hover styling (without drag)
-        self.hover_style = f"""
-            QLabel {{
+            QLabel[dropState="hover"] {{
                 {DEFAULT_FONT}
                 font-size: 14px;
                 color: {MUTED_TEXT_COLOR};
                 background-color: #1a1a1a;
                 border-radius: 4px;
             }}
-        """
-
-        # Highlight styling for drag hover
-        self.highlight_style = f"""
-            QLabel {{
+            QLabel[dropState="drag"] {{
                 {DEFAULT_FONT}
                 font-size: 14px;
                 color: #FFFFFF;
@@ -279,9 +314,8 @@ class DragDropVideoLabel(QLabel):
                 border: 2px dashed {ACCENT_COLOR};
                 border-radius: 4px;
             }}
-        """
-
-        self.setStyleSheet(self.normal_style)
+        """)
+        self._set_drop_state("normal")
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
@@ -308,37 +342,46 @@ class DragDropVideoLabel(QLabel):
         """Set parent application reference to access video loading methods"""
         self.parent_app = app
 
+    def _set_drop_state(self, state):
+        """Switch the visual state (normal/hover/drag) via the dynamic
+        property the stylesheet keys on"""
+        if self.property("dropState") != state:
+            self.setProperty("dropState", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
+
+    @classmethod
+    def _default_icon_pixmap(cls):
+        """Render the upload SVG to a pixmap, once per process.
+
+        Returns None when the SVG is missing or invalid; either outcome
+        is remembered so later calls are a plain attribute read."""
+        if not cls._default_pixmap_resolved:
+            cls._default_pixmap_resolved = True
+            if os.path.exists(_SVG_PATH):
+                try:
+                    svg_renderer = QSvgRenderer(_SVG_PATH)
+                    if svg_renderer.isValid():
+                        pixmap = QPixmap(80, 80)
+                        pixmap.fill(Qt.GlobalColor.transparent)
+                        painter = QPainter(pixmap)
+                        svg_renderer.render(painter)
+                        painter.end()
+                        cls._default_pixmap_cache = pixmap
+                except Exception:
+                    pass
+        return cls._default_pixmap_cache
+
     def set_default_content(self):
         """Set the default content with SVG icon and text"""
         # Clear the video pixmap if present
         self.clear()
 
-        if self.is_hovered:
-            self.setStyleSheet(self.hover_style)
-        else:
-            self.setStyleSheet(self.normal_style)
-
-        assets_dir = os.path.join(os.getcwd(), "assets")
-        svg_path = os.path.join(assets_dir, "video-upload.svg")
+        self._set_drop_state("hover" if self.is_hovered else "normal")
 
-        if os.path.exists(svg_path):
-            try:
-                svg_renderer = QSvgRenderer(svg_path)
-                if svg_renderer.isValid():
-                    pixmap = QPixmap(80, 80)
-                    pixmap.fill(Qt.GlobalColor.transparent)
-                    painter = QPainter(pixmap)
-                    svg_renderer.render(painter)
-                    painter.end()
-                    self.icon_label.setPixmap(pixmap)
-                else:
-                    # Fallback
-                    self.icon_label.setText("📁")
-                    self.icon_label.setStyleSheet(f"font-size: 48px; color: {MUTED_TEXT_COLOR}; border: none;")
-            except Exception as e:
-                # Fallback icon
-                self.icon_label.setText("📁")
-                self.icon_label.setStyleSheet(f"font-size: 48px; color: {MUTED_TEXT_COLOR}; border: none;")
+        pixmap = self._default_icon_pixmap()
+        if pixmap is not None:
+            self.icon_label.setPixmap(pixmap)
         else:
             # Fallback icon
             self.icon_label.setText("📁")
@@ -351,14 +394,14 @@ class DragDropVideoLabel(QLabel):
         """Handle mouse enter events - darken background"""
         if not self.is_hovered:
             self.is_hovered = True
-            self.setStyleSheet(self.hover_style)
+            self._set_drop_state("hover")
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         """Handle mouse leave events - restore normal background"""
         if self.is_hovered:
             self.is_hovered = False
-            self.setStyleSheet(self.normal_style)
+            self._set_drop_state("normal")
         super().leaveEvent(event)
 
     def mouseReleaseEvent(self, event):
@@ -371,13 +414,13 @@ class DragDropVideoLabel(QLabel):
         """Accept drag enter events that contain file URLs"""
         if event.mimeData().hasUrls():
             self.is_hovered = True
-            self.setStyleSheet(self.highlight_style)
+            self._set_drop_state("drag")
             event.acceptProposedAction()
 
     def dragLeaveEvent(self, event):
         """Reset style when drag leaves"""
         self.is_hovered = False
-        self.setStyleSheet(self.normal_style)
+        self._set_drop_state("normal")
         super().dragLeaveEvent(event)
 
     def dragMoveEvent(self, event):
@@ -389,7 +432,7 @@ class DragDropVideoLabel(QLabel):
         """Handle file drop events"""
         # Reset style
         self.is_hovered = False
-        self.setStyleSheet(self.normal_style)
+        self._set_drop_state("normal")
 
         if event.mimeData().hasUrls() and self.parent_app is not None:
             urls = event.mimeData().urls()